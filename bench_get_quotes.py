@@ -0,0 +1,56 @@
+"""
+Benchmarks get_quotes against a local stub of Firstrade.
+
+Every quote request takes a fixed delay, like a round trip to Firstrade,
+so the timings show how the wall-clock time of a batch scales with the
+number of workers. Run it with python bench_get_quotes.py.
+"""
+
+import tempfile
+import time
+from urllib.parse import parse_qs, urlparse
+
+from firstrade.symbols import get_quotes
+from test_login import StubAdapter, stub_session
+
+QUOTE_DELAY = 0.05
+SYMBOLS = [f"SYM{i}" for i in range(64)]
+WORKERS = (1, 2, 4, 8, 16, 32)
+
+QUOTE = """<?xml version="1.0" encoding="UTF-8"?>
+<response><quote><symbol>{symbol}</symbol><underlying_symbol>{symbol}</underlying_symbol>
+<tick>U</tick><exchange>NASDAQ</exchange><bid>10.00</bid><ask>10.05</ask>
+<last>10.02</last><bidsize>100</bidsize><asksize>200</asksize><lastsize>50</lastsize>
+<bidmmid>Q</bidmmid><askmmid>Q</askmmid><lastmmid>Q</lastmmid><change>0.12</change>
+<high>10.20</high><low>9.90</low><changecolor>green</changecolor><vol>1,234,567</vol>
+<bidxask>100x200</bidxask><quotetime>10:00:00</quotetime>
+<lasttradetime>10:00:00</lasttradetime><realtime>T</realtime>
+<fractional>T</fractional><errcode>0</errcode><companyname>{symbol} Inc</companyname>
+</quote></response>"""
+
+
+class QuoteStub(StubAdapter):
+    """Stub that answers quote requests after QUOTE_DELAY seconds."""
+
+    def reply(self, request, path, headers):
+        query = parse_qs(urlparse(request.url).query)
+        if path == "/cgi-bin/getxml" and query.get("page") == ["quo"]:
+            time.sleep(QUOTE_DELAY)
+            return QUOTE.format(symbol=query["quoteSymbol"][0])
+        return super().reply(request, path, headers)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as profile_path:
+        ft_session = stub_session(QuoteStub(), profile_path)
+        print(f"{len(SYMBOLS)} symbols, {QUOTE_DELAY * 1000:.0f} ms per quote request")
+        for max_workers in WORKERS:
+            start = time.perf_counter()
+            quotes = get_quotes(ft_session, SYMBOLS, max_workers=max_workers)
+            elapsed = time.perf_counter() - start
+            assert not any(isinstance(quote, Exception) for quote in quotes.values())
+            print(f"{max_workers:>3} workers: {elapsed:6.3f} s")
+
+
+if __name__ == "__main__":
+    main()
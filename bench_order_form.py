@@ -0,0 +1,48 @@
+"""
+Benchmarks encoding an orderbar form with ORDER_FORM against encoding
+the full 30-field form with requests, as every order did before.
+
+Run it with python bench_order_form.py.
+"""
+
+import timeit
+from urllib.parse import parse_qs
+
+from requests.models import RequestEncodingMixin
+
+from firstrade.order import (
+    ORDER_FORM,
+    Duration,
+    OrderType,
+    PriceType,
+    build_order_data,
+)
+
+ROUNDS = 20000
+ORDER = ("12345678", "INTC", PriceType.LIMIT, OrderType.BUY, 10, Duration.DAY, 30.50)
+
+
+def encode_full_form(data):
+    """Builds and encodes the whole form of a preview, like the previous releases."""
+    form = dict(ORDER_FORM.constant_fields)
+    form.update(previewOrders="1", submitOrders="", viewederror="")
+    form.update(data)
+    return RequestEncodingMixin._encode_params(form)
+
+
+def main():
+    data = build_order_data(*ORDER)
+    assert parse_qs(encode_full_form(data), keep_blank_values=True) == parse_qs(
+        ORDER_FORM.encode(data).decode("utf-8"), keep_blank_values=True
+    )
+    print("time per order")
+    for name, encode in (
+        ("full form", lambda: encode_full_form(build_order_data(*ORDER))),
+        ("ORDER_FORM", lambda: ORDER_FORM.encode(build_order_data(*ORDER))),
+    ):
+        elapsed = timeit.timeit(encode, number=ROUNDS) / ROUNDS
+        print(f"{name:>10}: {elapsed * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
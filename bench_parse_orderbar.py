@@ -0,0 +1,85 @@
+"""
+Benchmarks parse_orderbar against the nested BeautifulSoup parsing it replaced,
+on the sample orderbar responses in fixtures/.
+
+Run it with python bench_parse_orderbar.py.
+"""
+
+import timeit
+
+from bs4 import BeautifulSoup
+
+from firstrade.order import parse_orderbar
+from test_parsers import fixture
+
+ROUNDS = 500
+RESPONSES = (
+    ("preview", "orderbar_preview.xml", True),
+    ("submit", "orderbar_submit.xml", False),
+)
+
+
+def parse_with_bs4(xml_string, dry_run=True):
+    """The warning and confirmation parsing of the previous releases."""
+    order_data = BeautifulSoup(xml_string, "xml")
+    cdata = order_data.find("actiondata").string
+    span = (
+        BeautifulSoup(cdata, "html.parser")
+        .find("div", class_="msg_bg")
+        .find("div", class_="yellow box")
+        .find("div", class_="error_msg")
+        .find("div", class_="outbox")
+        .find("div", class_="inbox")
+        .find("span")
+    )
+    order_confirmation = {}
+    if span:
+        order_confirmation["warning"] = span.text.strip()
+    order_confirmation["success"] = order_data.find("success").text.strip()
+    action_data = order_data.find("actiondata").text.strip()
+    table_start = action_data.find("<table")
+    table_end = action_data.find("</table>") + len("</table>")
+    table_data = BeautifulSoup(action_data[table_start:table_end], "xml")
+    titles = table_data.find_all("th")
+    data = table_data.find_all("td")
+    for i, title in enumerate(titles):
+        order_confirmation[title.get_text()] = data[i].get_text()
+    if dry_run:
+        start = action_data.find('id="') + len('id="')
+        end = action_data.find('" style=', start)
+    else:
+        start = action_data.find("Your order reference number is: ") + len(
+            "Your order reference number is: "
+        )
+        end = action_data.find("</div>", start)
+    order_confirmation["orderid"] = action_data[start:end]
+    order_confirmation["errcode"] = order_data.find("errcode").text.strip()
+    return order_confirmation
+
+
+def with_warning_box(xml):
+    """Adds the empty warning box the old parser needed to not raise."""
+    if b"msg_bg" in xml:
+        return xml
+    return xml.replace(
+        b"<![CDATA[",
+        b'<![CDATA[<div class="msg_bg"><div class="yellow box"><div class="error_msg">'
+        b'<div class="outbox"><div class="inbox"></div></div></div></div></div>',
+    )
+
+
+def main():
+    print("time per response")
+    for name, filename, dry_run in RESPONSES:
+        xml = with_warning_box(fixture(filename))
+        assert parse_with_bs4(xml, dry_run) == parse_orderbar(xml, dry_run)
+        for parser_name, parser in (
+            ("BeautifulSoup", parse_with_bs4),
+            ("parse_orderbar", parse_orderbar),
+        ):
+            elapsed = timeit.timeit(lambda: parser(xml, dry_run), number=ROUNDS)
+            print(f"{name:>8} {parser_name:>14}: {elapsed / ROUNDS * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmarks parse_positions against the six find_all scans it replaced,
+on a 500-position response built from fixtures/positions.xml.
+
+Run it with python bench_parse_positions.py.
+"""
+
+import re
+import timeit
+
+from bs4 import BeautifulSoup
+
+from firstrade.account import parse_positions
+from test_parsers import fixture
+
+POSITIONS = 500
+ROUNDS = 10
+
+
+def positions_response(count):
+    """Repeats the positions of the fixture under new symbols."""
+    xml = fixture("positions.xml").decode("utf-8")
+    rows = re.findall(r"<position>.*?</position>", xml)
+    body = "".join(
+        re.sub(r"<symbol>\w+</symbol>", f"<symbol>SYM{i}</symbol>", rows[i % len(rows)])
+        for i in range(count)
+    )
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?>\n<response>{body}</response>'.encode()
+    )
+
+
+def parse_with_find_all(xml_string):
+    """The positions parsing of the previous releases."""
+    position_soup = BeautifulSoup(xml_string, "xml")
+    tickers = position_soup.find_all("symbol")
+    quantity = position_soup.find_all("quantity")
+    price = position_soup.find_all("price")
+    change = position_soup.find_all("change")
+    change_percent = position_soup.find_all("changepercent")
+    vol = position_soup.find_all("vol")
+    securities_held = {}
+    for i, ticker in enumerate(tickers):
+        securities_held[ticker.text] = {
+            "quantity": quantity[i].text,
+            "price": price[i].text,
+            "change": change[i].text,
+            "change_percent": change_percent[i].text,
+            "vol": vol[i].text,
+        }
+    return securities_held
+
+
+def main():
+    xml = positions_response(POSITIONS)
+    assert parse_with_find_all(xml).keys() == parse_positions(xml).keys()
+    print(f"time per {POSITIONS}-position response")
+    for name, parser in (
+        ("find_all", parse_with_find_all),
+        ("parse_positions", parse_positions),
+    ):
+        elapsed = timeit.timeit(lambda: parser(xml), number=ROUNDS)
+        print(f"{name:>15}: {elapsed / ROUNDS * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
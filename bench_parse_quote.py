@@ -0,0 +1,27 @@
+"""
+Benchmarks parse_quote with its lxml and BeautifulSoup backends
+on the sample quote responses in fixtures/.
+
+Run it with python bench_parse_quote.py.
+"""
+
+import timeit
+
+from firstrade.symbols import parse_quote
+from test_parsers import fixture
+
+ROUNDS = 1000
+RESPONSES = ("quote.xml", "quote_closed.xml")
+
+
+def main():
+    print("time per quote")
+    for name in RESPONSES:
+        xml = fixture(name)
+        for parser in ("bs4", "lxml"):
+            elapsed = timeit.timeit(lambda: parse_quote(xml, parser), number=ROUNDS)
+            print(f"{name:>16} {parser:>4}: {elapsed / ROUNDS * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
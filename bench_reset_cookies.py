@@ -0,0 +1,65 @@
+"""
+Benchmarks restoring the login cookies before each account is loaded.
+
+Compares reloading the cookies from a profile directory holding 50 cookie
+files, as every account did before, with FTSession.reset_cookies, which
+restores them from the in-memory login snapshot.
+Run it with python bench_reset_cookies.py.
+"""
+
+import os
+import pickle
+import tempfile
+import timeit
+
+from test_login import StubAdapter, stub_session
+
+COOKIE_FILES = 50
+ROUNDS = 2000
+
+
+def load_pickled_cookies(directory, username):
+    """The per-account cookie reload of the previous releases."""
+    cookies = {}
+    for filename in os.listdir(directory):
+        if filename.endswith(f"{username}.pkl"):
+            with open(os.path.join(directory, filename), "rb") as f:
+                cookies = pickle.load(f)
+    return cookies
+
+
+def main():
+    with tempfile.TemporaryDirectory() as profile_path:
+        ft_session = stub_session(StubAdapter(), profile_path)
+        cookies = ft_session.session.cookies.get_dict()
+        for i in range(COOKIE_FILES):
+            username = ft_session.username if i == 0 else f"other{i}"
+            with open(
+                os.path.join(profile_path, f"ft_cookies{username}.pkl"), "wb"
+            ) as f:
+                pickle.dump(cookies, f)
+            if i:
+                ft_session.session_store.save(username, ft_session.session.cookies)
+
+        def reload_pickle():
+            ft_session.session.cookies.clear()
+            ft_session.session.cookies.update(
+                load_pickled_cookies(profile_path, ft_session.username)
+            )
+
+        def reload_store():
+            ft_session.session.cookies.clear()
+            ft_session.session.cookies.update(ft_session.load_cookies())
+
+        print(f"{COOKIE_FILES} cookie files, time per account")
+        for name, reset in (
+            ("reload pickle from disk", reload_pickle),
+            ("reload from session store", reload_store),
+            ("reset_cookies snapshot", ft_session.reset_cookies),
+        ):
+            elapsed = timeit.timeit(reset, number=ROUNDS) / ROUNDS
+            print(f"{name:>26}: {elapsed * 1e6:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
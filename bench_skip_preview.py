@@ -0,0 +1,67 @@
+"""
+Benchmarks the latency of place_order with and without skip_preview
+against a local stub of the orderbar endpoint.
+
+Every orderbar request takes a fixed delay, like a round trip to Firstrade.
+Run it with python bench_skip_preview.py.
+"""
+
+import tempfile
+import time
+from urllib.parse import parse_qs
+
+from firstrade.order import Duration, Order, OrderType, PriceType
+from test_login import StubAdapter, stub_session
+from test_parsers import fixture
+
+ORDERBAR_DELAY = 0.05
+ORDERS = 20
+
+
+class OrderbarStub(StubAdapter):
+    """Stub that answers orderbar previews and submits after ORDERBAR_DELAY seconds."""
+
+    def reply(self, request, path, headers):
+        if path == "/cgi-bin/orderbar":
+            time.sleep(ORDERBAR_DELAY)
+            form = parse_qs(request.body.decode("utf-8"), keep_blank_values=True)
+            if form["submitOrders"] == ["1"]:
+                return fixture("orderbar_submit.xml").decode("utf-8")
+            return fixture("orderbar_preview.xml").decode("utf-8")
+        return super().reply(request, path, headers)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as profile_path:
+        stub = OrderbarStub()
+        order = Order(stub_session(stub, profile_path))
+        print(f"{ORDERBAR_DELAY * 1000:.0f} ms per orderbar request")
+        for name, skip_preview in (
+            ("preview and submit", False),
+            ("skip_preview", True),
+        ):
+            stub.counts.clear()
+            start = time.perf_counter()
+            for _ in range(ORDERS):
+                confirmation = order.place_order(
+                    "12345678",
+                    "INTC",
+                    PriceType.LIMIT,
+                    OrderType.BUY,
+                    10,
+                    Duration.DAY,
+                    price=30.50,
+                    dry_run=False,
+                    skip_preview=skip_preview,
+                )
+                assert confirmation["orderid"] == "118734562"
+            elapsed = (time.perf_counter() - start) / ORDERS
+            posts = stub.counts["/cgi-bin/orderbar"] / ORDERS
+            print(
+                f"{name:>18}: {elapsed * 1000:6.1f} ms per order, "
+                f"{posts:.0f} orderbar requests"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,25 @@
-from . import account, order, symbols, urls
+from . import (
+    account,
+    cache,
+    frame,
+    order,
+    ratelimit,
+    store,
+    stream,
+    symbols,
+    tracker,
+    urls,
+)
 
-__all__ = ["account", "order", "symbols", "urls"]
+__all__ = [
+    "account",
+    "cache",
+    "frame",
+    "order",
+    "ratelimit",
+    "store",
+    "stream",
+    "symbols",
+    "tracker",
+    "urls",
+]
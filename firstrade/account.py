@@ -1,17 +1,40 @@
-import os
-import pickle
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from typing import NamedTuple, Optional, Union
 
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
 
 from firstrade import urls
+from firstrade.cache import QuoteCache
+from firstrade.ratelimit import endpoint_class
+from firstrade.store import FileSessionStore
+from firstrade.utils import parse_xml, to_decimal, to_int, to_number
 
 
 class FTSession:
     """Class creating a session for Firstrade."""
 
-    def __init__(self, username, password, pin, profile_path=None):
+    def __init__(
+        self,
+        username,
+        password,
+        pin,
+        profile_path=None,
+        quote_cache_ttl=0,
+        quote_cache_size=256,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_block=False,
+        max_retries=0,
+        session_store=None,
+        auto_relogin=True,
+        scheduler=None,
+    ):
         """
         Initializes a new instance of the FTSession class.
 
@@ -20,104 +43,224 @@ class FTSession:
             password (str): Firstrade login password.
             pin (str): Firstrade login pin.
             persistent_session (bool, optional): Whether the user wants to save the session cookies.
-            profile_path (str, optional): The path where the user wants to save the cookie pkl file.
+            profile_path (str, optional): The path where the user wants to save the cookie json file.
+            quote_cache_ttl (float, optional): Seconds a quote is served from the session
+                quote cache. Defaults to 0, which always fetches a fresh quote.
+            quote_cache_size (int, optional): Maximum number of symbols in the quote cache.
+                                              Defaults to 256.
+            pool_connections (int, optional): Number of host connection pools to keep.
+                                              Defaults to 10.
+            pool_maxsize (int, optional): Maximum number of connections kept open per host.
+                Set it to at least the number of threads sharing the session. Defaults to 10.
+            pool_block (bool, optional): Whether to wait for a free connection instead of
+                opening a throwaway one when the pool is exhausted. Defaults to False.
+            max_retries (int or urllib3.util.Retry, optional): Retry policy for failed
+                connections. Defaults to 0.
+            session_store (SessionStore, optional): Where the login cookies are shared
+                between sessions. Defaults to a FileSessionStore in profile_path.
+            auto_relogin (bool, optional): Whether to log in again and replay a request
+                when its response shows the session expired. Defaults to True.
+            scheduler (RequestScheduler, optional): Rate limiter every request waits on,
+                which can be shared between sessions. Defaults to no limit.
         """
         self.username = username
         self.password = password
         self.pin = pin
         self.profile_path = profile_path
+        self.session_store = (
+            session_store
+            if session_store is not None
+            else FileSessionStore(profile_path)
+        )
+        self.quote_cache = QuoteCache(ttl=quote_cache_ttl, max_size=quote_cache_size)
         self.session = requests.Session()
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=max_retries,
+        )
+        self.session.mount("https://", self.adapter)
+        self.auto_relogin = auto_relogin
+        self.scheduler = scheduler
+        self._login_lock = threading.Lock()
+        self._login_count = 0
         self.login()
 
     def login(self):
-        """Method to validate and login to the Firstrade platform."""
-        headers = urls.session_headers()
+        """
+        Method to validate and login to the Firstrade platform.
+
+        The login runs in three steps: probe the saved cookies, and only if
+        they are not logged in, do the full username/password/pin login and
+        verify it. A session restored from saved cookies costs one request.
+        The full login runs under the session store lock, so when many
+        processes share a login only one of them logs in and the others
+        adopt the cookies it saved.
+        """
         cookies = self.load_cookies()
-        cookies = requests.utils.cookiejar_from_dict(cookies)
         self.session.cookies.update(cookies)
-        response = self.session.get(
-            url=urls.get_xml(), headers=urls.session_headers(), cookies=cookies
-        )
+        if self._probe():
+            self._logged_in()
+        else:
+            self._refresh_login(cookies)
+
+    def _refresh_login(self, cookies):
+        """
+        Replaces an expired login under the session store lock.
+
+        Args:
+            cookies (CookieJar): The cookies that were found to be expired.
+        """
+        with self.session_store.lock(self.username):
+            # another process may have logged in while we waited for the lock
+            saved_cookies = self.load_cookies()
+            adopted = _cookie_values(saved_cookies) != _cookie_values(cookies)
+            if adopted:
+                self.session.cookies.update(saved_cookies)
+            if not adopted or not self._probe():
+                self._full_login()
+                if not self._probe():
+                    raise Exception("Login failed. Check your credentials.")
+                self.save_cookies()
+        self._logged_in()
+
+    def _logged_in(self):
+        """Records a successful login."""
+        # keep the base login cookies to reset account selection without disk reads
+        self.login_cookies = self.session.cookies.copy()
+        self._login_count += 1
+
+    def request(self, method, url, **kwargs):
+        """
+        Sends a request, logging in again once if the session expired.
+
+        The request first waits for the scheduler, if one is set. When the
+        response is the failed session page, the session logs in again and
+        the request is replayed. Threads that hit the expired session at the
+        same time wait for a single login.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL to request.
+            **kwargs: Passed on to requests.Session.request.
+
+        Returns:
+            requests.Response: The response.
+        """
+        login_count = self._login_count
+        response = self._send(method, url, **kwargs)
+        if not self.auto_relogin or not _session_failed(response):
+            return response
+        with self._login_lock:
+            # skip the login if another thread already logged in again
+            if self._login_count == login_count:
+                self._refresh_login(self.login_cookies)
+        return self._send(method, url, **kwargs)
+
+    def _send(self, method, url, **kwargs):
+        """Sends a request once the scheduler allows it."""
+        if self.scheduler is not None:
+            self.scheduler.acquire(endpoint_class(url))
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        """Sends a GET request. See request()."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        """Sends a POST request. See request()."""
+        return self.request("POST", url, **kwargs)
+
+    def _probe(self):
+        """
+        Checks if the session cookies are logged in.
+
+        Returns:
+            bool: True if the session is logged in.
+        """
+        response = self.session.get(url=urls.get_xml(), headers=urls.session_headers())
         if response.status_code != 200:
             raise Exception(
                 "Login failed. Check your credentials or internet connection."
             )
-        if "/cgi-bin/sessionfailed?reason=6" in response.text:
-            self.session.get(url=urls.login(), headers=headers)
-            data = {
-                "redirect": "",
-                "ft_locale": "en-us",
-                "login.x": "Log In",
-                "username": r"" + self.username,
-                "password": r"" + self.password,
-                "destination_page": "home",
-            }
+        return not _session_failed(response)
 
-            self.session.post(
-                url=urls.login(),
-                headers=headers,
-                cookies=self.session.cookies,
-                data=data,
-            )
-            data = {
-                "destination_page": "home",
-                "pin": self.pin,
-                "pin.x": "++OK++",
-                "sring": "0",
-                "pin": self.pin,
-            }
+    def _full_login(self):
+        """Logs in with the username, password and pin."""
+        headers = urls.session_headers()
+        self.session.get(url=urls.login(), headers=headers)
+        self.session.post(
+            url=urls.login(),
+            headers=headers,
+            cookies=self.session.cookies,
+            data=_login_form(self.username, self.password),
+        )
+        self.session.post(
+            url=urls.pin(),
+            headers=headers,
+            cookies=self.session.cookies,
+            data=_pin_form(self.pin),
+        )
 
-            self.session.post(
-                url=urls.pin(), headers=headers, cookies=self.session.cookies, data=data
-            )
-            self.save_cookies()
-        if (
-            "/cgi-bin/sessionfailed?reason=6"
-            in self.session.get(
-                url=urls.get_xml(), headers=urls.session_headers(), cookies=cookies
-            ).text
-        ):
-            raise Exception("Login failed. Check your credentials.")
+    def reset_cookies(self):
+        """Restores the session cookies to the base login cookies."""
+        self.session.cookies.clear()
+        self.session.cookies.update(self.login_cookies)
 
     def load_cookies(self):
         """
         Checks if session cookies were saved.
 
         Returns:
-            Dict: Dictionary of cookies. Nom Nom
+            RequestsCookieJar: The saved cookies with their domain, path and expiry. Nom Nom
         """
-        cookies = {}
-        directory = os.path.abspath(self.profile_path) if self.profile_path is not None else "."
-        
-        if not os.path.exists(directory):
-            os.makedirs(directory)
-
-        for filename in os.listdir(directory):
-            if filename.endswith(f"{self.username}.pkl"):
-                filepath = os.path.join(directory, filename)
-                with open(filepath, "rb") as f:
-                    cookies = pickle.load(f)
-        return cookies
+        return self.session_store.load(self.username)
 
     def save_cookies(self):
-        """Saves session cookies to a file."""
-        if self.profile_path is not None:
-            directory = os.path.abspath(self.profile_path)
-            if not os.path.exists(directory):
-                os.makedirs(directory)
-            path = os.path.join(self.profile_path, f"ft_cookies{self.username}.pkl")
-        else:
-            path = f"ft_cookies{self.username}.pkl"
-        with open(path, "wb") as f:
-            pickle.dump(self.session.cookies.get_dict(), f)
-    
-    def delete_cookies(self):    
+        """Saves session cookies to the session store."""
+        self.session_store.save(self.username, self.session.cookies)
+
+    def delete_cookies(self):
         """Deletes the session cookies."""
-        if self.profile_path is not None:
-            path = os.path.join(self.profile_path, f"ft_cookies{self.username}.pkl")
-        else:
-            path = f"ft_cookies{self.username}.pkl"
-        os.remove(path)
+        self.session_store.delete(self.username)
+
+    def connection_stats(self):
+        """
+        Counts the connections opened and reused by the session.
+
+        Returns:
+            dict: The number of requests sent, connections opened
+            and requests that reused an already open connection.
+        """
+        pools = self.adapter.poolmanager.pools
+        opened = 0
+        sent = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                opened += pool.num_connections
+                sent += pool.num_requests
+        return {"requests": sent, "opened": opened, "reused": max(sent - opened, 0)}
+
+    def _clone(self):
+        """
+        Creates a copy of this session with its own cookie jar.
+
+        The copy shares the credentials and the connection pool of this
+        session, but account selection on it does not affect this session.
+
+        Returns:
+            FTSession: The cloned session, loaded with the base login cookies.
+        """
+        clone = object.__new__(FTSession)
+        clone.__dict__.update(self.__dict__)
+        clone.session = requests.Session()
+        clone.session.headers.update(self.session.headers)
+        for prefix, adapter in self.session.adapters.items():
+            clone.session.mount(prefix, adapter)
+        clone.session.cookies.update(self.login_cookies)
+        return clone
 
     def __getattr__(self, name):
         """
@@ -135,89 +278,172 @@ class FTSession:
 class FTAccountData:
     """Dataclass for storing account information."""
 
-    def __init__(self, session):
+    def __init__(
+        self, session, concurrent=False, max_workers=8, lazy=False, numeric_type=float
+    ):
         """
         Initializes a new instance of the FTAccountData class.
 
         Args:
             session (requests.Session):
             The session object used for making HTTP requests.
+            concurrent (bool, optional): Whether to load the accounts in parallel.
+                Each account is loaded with its own cloned session because
+                selecting an account changes the session state. Defaults to False.
+            max_workers (int, optional): Maximum number of accounts loaded at once
+                                         when concurrent is True. Defaults to 8.
+            lazy (bool, optional): Whether to only get the account numbers up front.
+                The status and balance of an account are then fetched the first
+                time they are accessed and kept afterwards. Defaults to False.
+            numeric_type (type, optional): float or decimal.Decimal, the type balances,
+                position prices and changes are parsed into. Defaults to float.
         """
         self.session = session
-        self.all_accounts = []
+        self.numeric_type = numeric_type
+        self.concurrent = concurrent
+        self.max_workers = max_workers
         self.account_numbers = []
-        self.account_statuses = []
-        self.account_balances = []
         self.securities_held = {}
-        all_account_info = []
+        self._account_data = {}
+        self._load_lock = threading.Lock()
         html_string = self.session.get(
             url=urls.account_list(),
             headers=urls.session_headers(),
             cookies=self.session.cookies,
         ).text
-        regex_accounts = re.findall(r"([0-9]+)-", html_string)
+        self.account_numbers = parse_account_list(html_string)
 
-        for match in regex_accounts:
-            self.account_numbers.append(match)
+        if not lazy:
+            self._load_accounts(self.account_numbers)
 
-        for account in self.account_numbers:
-            # reset cookies to base login cookies to run scripts
-            self.session.cookies.clear()
-            self.session.cookies.update(self.session.load_cookies())
-            # set account to get data for
-            data = {"accountId": account}
-            self.session.post(
-                url=urls.account_status(),
-                headers=urls.session_headers(),
-                cookies=self.session.cookies,
-                data=data,
-            )
-            # request to get account status data
-            data = {"req": "get_status"}
-            account_status = self.session.post(
-                url=urls.status(),
+    @property
+    def account_statuses(self):
+        """List of the status data of every account, in account_numbers order."""
+        self._load_accounts(self.account_numbers)
+        return [self._account_data[account][0] for account in self.account_numbers]
+
+    @property
+    def account_balances(self):
+        """List of the total value of every account, in account_numbers order."""
+        self._load_accounts(self.account_numbers)
+        return [self._account_data[account][1] for account in self.account_numbers]
+
+    @property
+    def all_accounts(self):
+        """List of dicts with the balance and status of every account."""
+        self._load_accounts(self.account_numbers)
+        return [
+            {account: _account_summary(*self._account_data[account])}
+            for account in self.account_numbers
+        ]
+
+    def get_account_status(self, account):
+        """
+        Gets the status data of a single account.
+
+        Args:
+            account (str): Account number of the account you want the status of.
+
+        Returns:
+            dict: The account status data.
+        """
+        self._load_accounts([account])
+        return self._account_data[account][0]
+
+    def get_account_balance(self, account):
+        """
+        Gets the total value of a single account.
+
+        Args:
+            account (str): Account number of the account you want the balance of.
+
+        Returns:
+            float or Decimal: The total account value.
+        """
+        self._load_accounts([account])
+        return self._account_data[account][1]
+
+    def _load_accounts(self, accounts):
+        """
+        Fetches the status and balance of the given accounts that are not loaded yet.
+
+        Args:
+            accounts (list): Account numbers of the accounts to load.
+        """
+        # accounts are selected on cloned sessions, so loading them never changes
+        # the account selection of the shared session other threads are using
+        with self._load_lock:
+            accounts = [
+                account for account in accounts if account not in self._account_data
+            ]
+            if self.concurrent and len(accounts) > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.max_workers, len(accounts))
+                ) as executor:
+                    results = list(
+                        executor.map(
+                            lambda account: self._load_account(
+                                self.session._clone(), account
+                            ),
+                            accounts,
+                        )
+                    )
+            else:
+                session = self.session._clone() if accounts else None
+                results = []
+                for account in accounts:
+                    # reset cookies to base login cookies to run scripts
+                    session.reset_cookies()
+                    results.append(self._load_account(session, account))
+
+            for account, result in zip(accounts, results):
+                self._account_data[account] = result
+
+    def _load_account(self, session, account):
+        """
+        Gets the status and balance of a single account.
+
+        Args:
+            session (FTSession): The session to make the requests with.
+                The account is selected on this session.
+            account (str): Account number of the account to load.
+
+        Returns:
+            tuple: The account status data and the total account value.
+        """
+        # set account to get data for
+        data = {"accountId": account}
+        session.post(
+            url=urls.account_status(),
+            headers=urls.session_headers(),
+            cookies=session.cookies,
+            data=data,
+        )
+        # request to get account status data
+        data = {"req": "get_status"}
+        account_status = session.post(
+            url=urls.status(),
+            headers=urls.session_headers(),
+            cookies=session.cookies,
+            data=data,
+        ).json()
+        data = {"page": "bal", "account_id": account}
+        balance = parse_balance(
+            session.post(
+                url=urls.get_xml(),
                 headers=urls.session_headers(),
-                cookies=self.session.cookies,
+                cookies=session.cookies,
                 data=data,
-            ).json()
-            self.account_statuses.append(account_status["data"])
-            data = {"page": "bal", "account_id": account}
-            account_soup = BeautifulSoup(
-                self.session.post(
-                    url=urls.get_xml(),
-                    headers=urls.session_headers(),
-                    cookies=self.session.cookies,
-                    data=data,
-                ).text,
-                "xml",
-            )
-            balance = account_soup.find("total_account_value").text
-            self.account_balances.append(balance)
-            all_account_info.append(
-                {
-                    account: {
-                        "Balance": balance,
-                        "Status": {
-                            "primary": account_status["data"]["primary"],
-                            "domestic": account_status["data"]["domestic"],
-                            "joint": account_status["data"]["joint"],
-                            "ira": account_status["data"]["ira"],
-                            "hasMargin": account_status["data"]["hasMargin"],
-                            "opLevel": account_status["data"]["opLevel"],
-                            "p_country": account_status["data"]["p_country"],
-                            "mrgnStatus": account_status["data"]["mrgnStatus"],
-                            "opStatus": account_status["data"]["opStatus"],
-                            "margin_id": account_status["data"]["margin_id"],
-                        },
-                    }
-                }
-            )
-
-        self.all_accounts = all_account_info
+            ).text,
+            self.numeric_type,
+        )
+        return account_status["data"], balance
 
     def get_positions(self, account):
         """Gets currently held positions for a given account.
 
+        Every call returns a new dict, which is also kept as securities_held.
+
         Args:
             account (str): Account number of the account you want to get positions for.
 
@@ -225,33 +451,214 @@ class FTAccountData:
             self.securities_held {dict}:
             Dict of held positions with the pos. ticker as the key.
         """
+        self.securities_held = self._fetch_positions(account)
+        return self.securities_held
+
+    def get_all_positions(self):
+        """
+        Gets currently held positions for every account concurrently.
+
+        Returns:
+            dict: Account numbers mapped to a new dict of their held positions,
+            with the pos. ticker as the key.
+        """
+        if not self.account_numbers:
+            return {}
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(self.account_numbers))
+        ) as executor:
+            positions = executor.map(self._fetch_positions, self.account_numbers)
+            return dict(zip(self.account_numbers, positions))
+
+    def _fetch_positions(self, account):
+        """
+        Requests the positions of an account.
+
+        Args:
+            account (str): Account number of the account you want to get positions for.
+
+        Returns:
+            dict: Dict of held positions with the pos. ticker as the key.
+        """
         data = {
             "page": "pos",
             "accountId": str(account),
         }
-        position_soup = BeautifulSoup(
+        return parse_positions(
             self.session.post(
                 url=urls.get_xml(),
                 headers=urls.session_headers(),
                 data=data,
                 cookies=self.session.cookies,
-            ).text,
-            "xml",
+            ).content,
+            self.numeric_type,
         )
 
-        tickers = position_soup.find_all("symbol")
-        quantity = position_soup.find_all("quantity")
-        price = position_soup.find_all("price")
-        change = position_soup.find_all("change")
-        change_percent = position_soup.find_all("changepercent")
-        vol = position_soup.find_all("vol")
-        for i, ticker in enumerate(tickers):
-            ticker = ticker.text
-            self.securities_held[ticker] = {
-                "quantity": quantity[i].text,
-                "price": price[i].text,
-                "change": change[i].text,
-                "change_percent": change_percent[i].text,
-                "vol": vol[i].text,
+
+def parse_account_list(html_string):
+    """
+    Parses the account numbers out of the account list page.
+
+    Args:
+        html_string (str): The page returned by the account list endpoint.
+
+    Returns:
+        list: The account numbers.
+    """
+    return re.findall(r"([0-9]+)-", html_string)
+
+
+def parse_balance(xml_string, numeric_type=float):
+    """
+    Parses the total account value out of a balance response.
+
+    Args:
+        xml_string (str): The XML returned by the balance page.
+        numeric_type (type, optional): float or decimal.Decimal. Defaults to float.
+
+    Returns:
+        float or Decimal: The total account value.
+    """
+    account_soup = BeautifulSoup(xml_string, "xml")
+    return to_number(account_soup.find("total_account_value").text, numeric_type)
+
+
+class Position(NamedTuple):
+    """
+    A position held in an account.
+
+    Quantities are Decimals so fractional shares stay exact. Prices and
+    changes are floats or Decimals, depending on the numeric type they
+    were parsed with. Fields that are missing from the response are None.
+    """
+
+    symbol: str
+    quantity: Optional[Decimal]
+    price: Optional[Union[float, Decimal]]
+    change: Optional[Union[float, Decimal]]
+    change_percent: Optional[Union[float, Decimal]]
+    vol: int
+
+
+def parse_position_records(xml_string, numeric_type=float):
+    """
+    Parses a positions response into Position records.
+
+    Each position element is read once with lxml, so a field missing from
+    one position cannot shift the fields of the others. BeautifulSoup is
+    used when lxml cannot parse the response.
+
+    Args:
+        xml_string (str or bytes): The XML returned by the positions page.
+        numeric_type (type, optional): float or decimal.Decimal, the type prices
+                                       and changes are parsed into. Defaults to float.
+
+    Returns:
+        list: The Position records in response order.
+    """
+    try:
+        records = [
+            {element.tag: element.text for element in symbol.getparent()}
+            for symbol in parse_xml(xml_string).iter("symbol")
+        ]
+    except etree.XMLSyntaxError:
+        position_soup = BeautifulSoup(xml_string, "xml")
+        records = [
+            {
+                element.name: element.text
+                for element in symbol.parent.find_all(recursive=False)
             }
-        return self.securities_held
+            for symbol in position_soup.find_all("symbol")
+        ]
+    return [
+        Position(
+            symbol=(record["symbol"] or "").strip(),
+            quantity=to_decimal(record.get("quantity")),
+            price=to_number(record.get("price"), numeric_type),
+            change=to_number(record.get("change"), numeric_type),
+            change_percent=to_number(record.get("changepercent"), numeric_type),
+            vol=to_int(record.get("vol")),
+        )
+        for record in records
+    ]
+
+
+def parse_positions(xml_string, numeric_type=float):
+    """
+    Parses a positions response.
+
+    Args:
+        xml_string (str or bytes): The XML returned by the positions page.
+        numeric_type (type, optional): float or decimal.Decimal, the type prices
+                                       and changes are parsed into. Defaults to float.
+
+    Returns:
+        dict: Dict of held positions with the pos. ticker as the key.
+        Quantities are Decimals, prices and changes of numeric_type and volumes ints.
+    """
+    return {
+        position.symbol: {
+            "quantity": position.quantity,
+            "price": position.price,
+            "change": position.change,
+            "change_percent": position.change_percent,
+            "vol": position.vol,
+        }
+        for position in parse_position_records(xml_string, numeric_type)
+    }
+
+
+def _account_summary(account_status, balance):
+    """Builds the all_accounts entry of an account from its status and balance."""
+    return {
+        "Balance": balance,
+        "Status": {
+            "primary": account_status["primary"],
+            "domestic": account_status["domestic"],
+            "joint": account_status["joint"],
+            "ira": account_status["ira"],
+            "hasMargin": account_status["hasMargin"],
+            "opLevel": account_status["opLevel"],
+            "p_country": account_status["p_country"],
+            "mrgnStatus": account_status["mrgnStatus"],
+            "opStatus": account_status["opStatus"],
+            "margin_id": account_status["margin_id"],
+        },
+    }
+
+
+def _cookie_values(cookies):
+    """Gets the identity and value of every cookie, to compare cookie jars."""
+    return {
+        (cookie.domain, cookie.path, cookie.name): cookie.value for cookie in cookies
+    }
+
+
+def _session_failed(response):
+    """Checks if a response is, or redirected to, the failed session page."""
+    # search the raw bytes so the body is not decoded just for the check
+    return "/cgi-bin/sessionfailed" in str(response.url) or (
+        b"/cgi-bin/sessionfailed" in response.content
+    )
+
+
+def _login_form(username, password):
+    """Builds the form data of the username and password login step."""
+    return {
+        "redirect": "",
+        "ft_locale": "en-us",
+        "login.x": "Log In",
+        "username": r"" + username,
+        "password": r"" + password,
+        "destination_page": "home",
+    }
+
+
+def _pin_form(pin):
+    """Builds the form data of the pin login step."""
+    return {
+        "destination_page": "home",
+        "pin": pin,
+        "pin.x": "++OK++",
+        "sring": "0",
+    }
@@ -0,0 +1,3 @@
+from . import account, order, symbols
+
+__all__ = ["account", "order", "symbols"]
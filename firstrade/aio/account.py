@@ -0,0 +1,513 @@
+import asyncio
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from firstrade import urls
+from firstrade.account import (
+    _account_summary,
+    _cookie_values,
+    _login_form,
+    _pin_form,
+    _session_failed,
+    parse_account_list,
+    parse_balance,
+    parse_positions,
+)
+from firstrade.cache import QuoteCache
+from firstrade.ratelimit import endpoint_class
+from firstrade.store import FileSessionStore
+
+
+class AsyncFTSession:
+    """
+    Class creating an asyncio session for Firstrade.
+
+    It mirrors FTSession on top of httpx, which is an optional dependency:
+    pip install firstrade[async]
+
+    Use it as an async context manager, or await login() after creating it
+    and aclose() when done.
+    """
+
+    def __init__(
+        self,
+        username,
+        password,
+        pin,
+        profile_path=None,
+        quote_cache_ttl=0,
+        quote_cache_size=256,
+        max_connections=10,
+        max_keepalive_connections=10,
+        retries=0,
+        session_store=None,
+        auto_relogin=True,
+        scheduler=None,
+    ):
+        """
+        Initializes a new instance of the AsyncFTSession class.
+
+        Args:
+            username (str): Firstrade login username.
+            password (str): Firstrade login password.
+            pin (str): Firstrade login pin.
+            profile_path (str, optional): The path where the user wants to save the cookie file.
+            quote_cache_ttl (float, optional): Seconds a quote is served from the session
+                quote cache. Defaults to 0, which always fetches a fresh quote.
+            quote_cache_size (int, optional): Maximum number of symbols in the quote cache.
+                                              Defaults to 256.
+            max_connections (int, optional): Maximum number of open connections.
+                                             Defaults to 10.
+            max_keepalive_connections (int, optional): Maximum number of idle connections
+                                                       kept open. Defaults to 10.
+            retries (int, optional): Number of retries for failed connections. Defaults to 0.
+            session_store (SessionStore, optional): Where the login cookies are shared
+                between sessions. Defaults to a FileSessionStore in profile_path.
+            auto_relogin (bool, optional): Whether to log in again and replay a request
+                when its response shows the session expired. Defaults to True.
+            scheduler (RequestScheduler, optional): Rate limiter every request waits on,
+                which can be shared between sessions. Defaults to no limit.
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncFTSession requires httpx. Install it with: pip install firstrade[async]"
+            )
+        self.username = username
+        self.password = password
+        self.pin = pin
+        self.profile_path = profile_path
+        self.session_store = (
+            session_store
+            if session_store is not None
+            else FileSessionStore(profile_path)
+        )
+        self.quote_cache = QuoteCache(ttl=quote_cache_ttl, max_size=quote_cache_size)
+        self.transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            retries=retries,
+        )
+        self.client = httpx.AsyncClient(transport=self.transport, follow_redirects=True)
+        self.login_cookies = httpx.Cookies()
+        self.auto_relogin = auto_relogin
+        self.scheduler = scheduler
+        self._login_lock = None
+        self._login_count = 0
+
+    async def __aenter__(self):
+        await self.login()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def login(self):
+        """
+        Method to validate and login to the Firstrade platform.
+
+        Like FTSession.login, a session restored from saved cookies costs one
+        request, and the full login runs under the session store lock.
+        """
+        cookies = self.load_cookies()
+        self.client.cookies.update(httpx.Cookies(cookies))
+        if await self._probe():
+            self._logged_in()
+        else:
+            await self._refresh_login(cookies)
+
+    async def _refresh_login(self, cookies):
+        """
+        Replaces an expired login under the session store lock.
+
+        Args:
+            cookies (CookieJar): The cookies that were found to be expired.
+        """
+        lock = self.session_store.lock(self.username)
+        await asyncio.get_running_loop().run_in_executor(None, lock.acquire)
+        try:
+            # another process may have logged in while we waited for the lock
+            saved_cookies = self.load_cookies()
+            adopted = _cookie_values(saved_cookies) != _cookie_values(cookies)
+            if adopted:
+                self.client.cookies.update(httpx.Cookies(saved_cookies))
+            if not adopted or not await self._probe():
+                await self._full_login()
+                if not await self._probe():
+                    raise Exception("Login failed. Check your credentials.")
+                self.save_cookies()
+        finally:
+            lock.release()
+        self._logged_in()
+
+    def _logged_in(self):
+        """Records a successful login."""
+        # keep the base login cookies to reset account selection without disk reads
+        self.login_cookies = httpx.Cookies(self.client.cookies)
+        self._login_count += 1
+
+    async def _probe(self):
+        """
+        Checks if the session cookies are logged in.
+
+        Returns:
+            bool: True if the session is logged in.
+        """
+        response = await self.client.get(
+            url=urls.get_xml(), headers=urls.session_headers()
+        )
+        if response.status_code != 200:
+            raise Exception(
+                "Login failed. Check your credentials or internet connection."
+            )
+        return not _session_failed(response)
+
+    async def _full_login(self):
+        """Logs in with the username, password and pin."""
+        headers = urls.session_headers()
+        await self.client.get(url=urls.login(), headers=headers)
+        await self.client.post(
+            url=urls.login(),
+            headers=headers,
+            data=_login_form(self.username, self.password),
+        )
+        await self.client.post(
+            url=urls.pin(), headers=headers, data=_pin_form(self.pin)
+        )
+
+    def reset_cookies(self):
+        """Restores the session cookies to the base login cookies."""
+        self.client.cookies = httpx.Cookies(self.login_cookies)
+
+    def load_cookies(self):
+        """
+        Checks if session cookies were saved.
+
+        Returns:
+            RequestsCookieJar: The saved cookies with their domain, path and expiry.
+        """
+        return self.session_store.load(self.username)
+
+    def save_cookies(self):
+        """Saves session cookies to the session store."""
+        self.session_store.save(self.username, self.client.cookies.jar)
+
+    def delete_cookies(self):
+        """Deletes the session cookies."""
+        self.session_store.delete(self.username)
+
+    async def request(self, method, url, **kwargs):
+        """
+        Sends a request, logging in again once if the session expired.
+
+        Works like FTSession.request: tasks that hit the expired session
+        at the same time wait for a single login before replaying.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL to request.
+            **kwargs: Passed on to httpx.AsyncClient.request.
+
+        Returns:
+            httpx.Response: The response.
+        """
+        login_count = self._login_count
+        response = await self._send(method, url, **kwargs)
+        if not self.auto_relogin or not _session_failed(response):
+            return response
+        if self._login_lock is None:
+            self._login_lock = asyncio.Lock()
+        async with self._login_lock:
+            # skip the login if another task already logged in again
+            if self._login_count == login_count:
+                await self._refresh_login(self.login_cookies.jar)
+        return await self._send(method, url, **kwargs)
+
+    async def _send(self, method, url, **kwargs):
+        """Sends a request once the scheduler allows it."""
+        if self.scheduler is not None:
+            await self.scheduler.acquire_async(endpoint_class(url))
+        return await self.client.request(method, url, **kwargs)
+
+    async def get(self, url, **kwargs):
+        """Sends a GET request. See request()."""
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        """Sends a POST request. See request()."""
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self):
+        """Closes the client and its connections."""
+        await self.client.aclose()
+
+    def _clone(self):
+        """
+        Creates a copy of this session with its own cookie jar.
+
+        The copy shares the credentials and the connection pool of this
+        session. It must not be closed, as that would close the shared pool.
+
+        Returns:
+            AsyncFTSession: The cloned session, loaded with the base login cookies.
+        """
+        clone = object.__new__(AsyncFTSession)
+        clone.__dict__.update(self.__dict__)
+        clone.client = httpx.AsyncClient(
+            transport=self.transport,
+            follow_redirects=True,
+            cookies=httpx.Cookies(self.login_cookies),
+        )
+        return clone
+
+
+class AsyncFTAccountData:
+    """
+    Dataclass for storing account information, loaded with an AsyncFTSession.
+
+    Create it with ``await AsyncFTAccountData.create(session)``.
+    """
+
+    def __init__(self, session, concurrent=False, max_workers=8, numeric_type=float):
+        """
+        Initializes an empty AsyncFTAccountData. Use create() to load it.
+
+        Args:
+            session (AsyncFTSession): The session object used for making HTTP requests.
+            concurrent (bool, optional): Whether to load the accounts in parallel,
+                each with its own cloned session. Defaults to False.
+            max_workers (int, optional): Maximum number of accounts loaded at once
+                                         when concurrent is True. Defaults to 8.
+            numeric_type (type, optional): float or decimal.Decimal, the type balances,
+                position prices and changes are parsed into. Defaults to float.
+        """
+        self.session = session
+        self.numeric_type = numeric_type
+        self.concurrent = concurrent
+        self.max_workers = max_workers
+        self.account_numbers = []
+        self.securities_held = {}
+        self._account_data = {}
+        self._load_lock = None
+
+    @classmethod
+    async def create(
+        cls, session, concurrent=False, max_workers=8, lazy=False, numeric_type=float
+    ):
+        """
+        Creates and loads a new AsyncFTAccountData.
+
+        Args:
+            session (AsyncFTSession): The session object used for making HTTP requests.
+            concurrent (bool, optional): Whether to load the accounts in parallel.
+                                         Defaults to False.
+            max_workers (int, optional): Maximum number of accounts loaded at once
+                                         when concurrent is True. Defaults to 8.
+            lazy (bool, optional): Whether to only get the account numbers. Status and
+                balance are then loaded by get_account_status, get_account_balance
+                or load_accounts. Defaults to False.
+            numeric_type (type, optional): float or decimal.Decimal, the type balances,
+                position prices and changes are parsed into. Defaults to float.
+
+        Returns:
+            AsyncFTAccountData: The account data.
+        """
+        account_data = cls(
+            session,
+            concurrent=concurrent,
+            max_workers=max_workers,
+            numeric_type=numeric_type,
+        )
+        response = await session.get(
+            url=urls.account_list(), headers=urls.session_headers()
+        )
+        account_data.account_numbers = parse_account_list(response.text)
+        if not lazy:
+            await account_data.load_accounts()
+        return account_data
+
+    @property
+    def account_statuses(self):
+        """List of the status data of every account, in account_numbers order."""
+        self._check_loaded()
+        return [self._account_data[account][0] for account in self.account_numbers]
+
+    @property
+    def account_balances(self):
+        """List of the total value of every account, in account_numbers order."""
+        self._check_loaded()
+        return [self._account_data[account][1] for account in self.account_numbers]
+
+    @property
+    def all_accounts(self):
+        """List of dicts with the balance and status of every account."""
+        self._check_loaded()
+        return [
+            {account: _account_summary(*self._account_data[account])}
+            for account in self.account_numbers
+        ]
+
+    async def get_account_status(self, account):
+        """
+        Gets the status data of a single account.
+
+        Args:
+            account (str): Account number of the account you want the status of.
+
+        Returns:
+            dict: The account status data.
+        """
+        await self.load_accounts([account])
+        return self._account_data[account][0]
+
+    async def get_account_balance(self, account):
+        """
+        Gets the total value of a single account.
+
+        Args:
+            account (str): Account number of the account you want the balance of.
+
+        Returns:
+            float or Decimal: The total account value.
+        """
+        await self.load_accounts([account])
+        return self._account_data[account][1]
+
+    async def load_accounts(self, accounts=None):
+        """
+        Fetches the status and balance of the given accounts that are not loaded yet.
+
+        Args:
+            accounts (list, optional): Account numbers of the accounts to load.
+                                       Defaults to all accounts.
+        """
+        if accounts is None:
+            accounts = self.account_numbers
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        # accounts are selected on cloned sessions, so loading them never changes
+        # the account selection of the shared session other tasks are using
+        async with self._load_lock:
+            accounts = [
+                account for account in accounts if account not in self._account_data
+            ]
+            if self.concurrent and len(accounts) > 1:
+                semaphore = asyncio.Semaphore(self.max_workers)
+
+                async def load(account):
+                    async with semaphore:
+                        return await self._load_account(self.session._clone(), account)
+
+                results = await asyncio.gather(*(load(account) for account in accounts))
+            else:
+                session = self.session._clone() if accounts else None
+                results = []
+                for account in accounts:
+                    # reset cookies to base login cookies to run scripts
+                    session.reset_cookies()
+                    results.append(await self._load_account(session, account))
+
+            for account, result in zip(accounts, results):
+                self._account_data[account] = result
+
+    def _check_loaded(self):
+        """Raises if some accounts were not loaded yet."""
+        if any(account not in self._account_data for account in self.account_numbers):
+            raise RuntimeError(
+                "Accounts are not loaded. Call await load_accounts() first."
+            )
+
+    async def _load_account(self, session, account):
+        """
+        Gets the status and balance of a single account.
+
+        Args:
+            session (AsyncFTSession): The session to make the requests with.
+                The account is selected on this session.
+            account (str): Account number of the account to load.
+
+        Returns:
+            tuple: The account status data and the total account value.
+        """
+        # set account to get data for
+        await session.post(
+            url=urls.account_status(),
+            headers=urls.session_headers(),
+            data={"accountId": account},
+        )
+        # request to get account status data
+        account_status = (
+            await session.post(
+                url=urls.status(),
+                headers=urls.session_headers(),
+                data={"req": "get_status"},
+            )
+        ).json()
+        balance = parse_balance(
+            (
+                await session.post(
+                    url=urls.get_xml(),
+                    headers=urls.session_headers(),
+                    data={"page": "bal", "account_id": account},
+                )
+            ).text,
+            self.numeric_type,
+        )
+        return account_status["data"], balance
+
+    async def get_positions(self, account):
+        """Gets currently held positions for a given account.
+
+        Every call returns a new dict, which is also kept as securities_held.
+
+        Args:
+            account (str): Account number of the account you want to get positions for.
+
+        Returns:
+            self.securities_held {dict}:
+            Dict of held positions with the pos. ticker as the key.
+        """
+        self.securities_held = await self._fetch_positions(account)
+        return self.securities_held
+
+    async def get_all_positions(self):
+        """
+        Gets currently held positions for every account concurrently.
+
+        Returns:
+            dict: Account numbers mapped to a new dict of their held positions,
+            with the pos. ticker as the key.
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def fetch(account):
+            async with semaphore:
+                return await self._fetch_positions(account)
+
+        positions = await asyncio.gather(
+            *(fetch(account) for account in self.account_numbers)
+        )
+        return dict(zip(self.account_numbers, positions))
+
+    async def _fetch_positions(self, account):
+        """
+        Requests the positions of an account.
+
+        Args:
+            account (str): Account number of the account you want to get positions for.
+
+        Returns:
+            dict: Dict of held positions with the pos. ticker as the key.
+        """
+        data = {
+            "page": "pos",
+            "accountId": str(account),
+        }
+        response = await self.session.post(
+            url=urls.get_xml(), headers=urls.session_headers(), data=data
+        )
+        return parse_positions(response.content, self.numeric_type)
@@ -0,0 +1,215 @@
+import asyncio
+
+from firstrade import urls
+from firstrade.order import (
+    ORDER_FORM,
+    Duration,
+    OrderInstructions,
+    OrderType,
+    PriceType,
+    build_batch_data,
+    build_order_data,
+    cached_fractional,
+    parse_orderbar,
+    parse_orders,
+)
+
+
+class AsyncOrder:
+    """
+    This class contains information about an order.
+    It also contains a coroutine to place an order with an AsyncFTSession.
+    """
+
+    def __init__(self, ft_session):
+        self.ft_session = ft_session
+        self.order_confirmation = {}
+        self.order_confirmations = []
+
+    async def place_order(
+        self,
+        account,
+        symbol,
+        price_type: PriceType,
+        order_type: OrderType,
+        quantity,
+        duration: Duration,
+        price=0.00,
+        dry_run=True,
+        notional=False,
+        order_instruction: OrderInstructions = None,
+        skip_preview=False,
+    ):
+        """
+        Builds and places an order.
+        :attr: 'order_confirmation`
+        contains the order confirmation data after order placement.
+
+        Args:
+            account (str): Account number of the account to place the order in.
+            symbol (str): Ticker to place the order for.
+            order_type (PriceType): Price Type i.e. LIMIT, MARKET, STOP, etc.
+            quantity (float): The number of shares to buy.
+            duration (Duration): Duration of the order i.e. DAY, GT90, etc.
+            price (float, optional): The price to buy the shares at. Defaults to 0.00.
+            dry_run (bool, optional): Whether you want the order to be placed or not.
+                                      Defaults to True.
+            skip_preview (bool, optional): Whether to submit the order directly, without
+                a preview first, saving a round trip. If the direct submit is rejected
+                with a warning, the order goes through the usual preview and submit.
+                Ignored for dry runs. Defaults to False.
+
+        Returns:
+            Order:order_confirmation: Dictionary containing the order confirmation data.
+        """
+        data = build_order_data(
+            account,
+            symbol,
+            price_type,
+            order_type,
+            quantity,
+            duration,
+            price,
+            notional,
+            order_instruction,
+            cached_fractional(self.ft_session, symbol),
+        )
+        if skip_preview and not dry_run:
+            order_confirmation = await self._submit(data, None)
+            # only a warning is worth a preview, a hard rejection stays rejected
+            if (
+                order_confirmation["success"] != "No"
+                or "warning" not in order_confirmation
+            ):
+                self.order_confirmation = order_confirmation
+                return order_confirmation
+
+        order_confirmation = await self._preview(data)
+        if not dry_run and order_confirmation["success"] != "No":
+            order_confirmation = await self._submit(
+                data, order_confirmation.get("warning")
+            )
+        self.order_confirmation = order_confirmation
+        return order_confirmation
+
+    async def place_orders(self, batch, dry_run=True, max_workers=4, approve=None):
+        """
+        Previews and places many orders concurrently.
+
+        Works like Order.place_orders: every order is previewed, the warnings of
+        the whole batch are passed to approve at once, then the approved orders
+        are submitted.
+
+        Args:
+            batch (list): One dict of order arguments per order, see
+                          Order.place_orders.
+            dry_run (bool, optional): Whether you want the orders to be placed or not.
+                                      Defaults to True.
+            max_workers (int, optional): Maximum number of concurrent requests.
+                                         Defaults to 4.
+            approve (callable, optional): Called with a dict of batch index to warning
+                message, it returns the indexes of the warned orders that may still be
+                submitted. Defaults to submitting every order.
+
+        Returns:
+            list: In batch order, the order confirmation dict of each order, or the
+            exception raised while placing it.
+
+        Raises:
+            ValueError: If an order has other arguments or breaks the ORDER_RULES.
+        """
+        orders = build_batch_data(self.ft_session, batch)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def limited(coroutine):
+            async with semaphore:
+                return await coroutine
+
+        results = await asyncio.gather(
+            *(limited(self._preview(data)) for data in orders), return_exceptions=True
+        )
+        warnings = {
+            i: preview["warning"]
+            for i, preview in enumerate(results)
+            if not isinstance(preview, Exception) and preview.get("warning")
+        }
+        approved = set(warnings) if approve is None else set(approve(warnings))
+        submit_indexes = [
+            i
+            for i, preview in enumerate(results)
+            if not dry_run
+            and not isinstance(preview, Exception)
+            and preview["success"] != "No"
+            and (i not in warnings or i in approved)
+        ]
+        submits = await asyncio.gather(
+            *(
+                limited(self._submit(orders[i], warnings.get(i)))
+                for i in submit_indexes
+            ),
+            return_exceptions=True,
+        )
+        for i, submitted in zip(submit_indexes, submits):
+            results[i] = submitted
+        self.order_confirmations = results
+        return results
+
+    async def _preview(self, data):
+        """
+        Sends an order preview.
+
+        Args:
+            data (dict): The order fields returned by build_order_data.
+
+        Returns:
+            dict: The parsed preview, including its warning if it has one.
+        """
+        order_response = (
+            await self.ft_session.post(
+                url=urls.orderbar(),
+                headers=urls.order_headers(),
+                content=ORDER_FORM.encode(data),
+            )
+        ).content
+        return parse_orderbar(order_response)
+
+    async def _submit(self, data, warning):
+        """
+        Submits a previewed order.
+
+        Args:
+            data (dict): The order fields returned by build_order_data.
+            warning (str): The warning of the preview, or None.
+
+        Returns:
+            dict: The parsed submit confirmation, led by the preview warning if any.
+        """
+        order_response = (
+            await self.ft_session.post(
+                url=urls.orderbar(),
+                headers=urls.order_headers(),
+                content=ORDER_FORM.encode(data, submit=True, viewed_error=warning),
+            )
+        ).content
+        order_confirmation = {"warning": warning} if warning else {}
+        order_confirmation.update(parse_orderbar(order_response, dry_run=False))
+        return order_confirmation
+
+
+async def get_orders(ft_session, account):
+    """
+    Retrieves existing order data for a given account.
+
+    Args:
+        ft_session (AsyncFTSession): The session object used for making HTTP requests to Firstrade.
+        account (str): Account number of the account to retrieve orders for.
+
+    Returns:
+        list: A list of dictionaries, each containing details about an order.
+    """
+    response = await ft_session.post(
+        url=urls.order_list(),
+        headers=urls.session_headers(),
+        data={"accountId": account},
+    )
+    return parse_orders(response.text)
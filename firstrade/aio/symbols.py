@@ -0,0 +1,59 @@
+import asyncio
+
+from firstrade import urls
+from firstrade.symbols import parse_quote
+
+
+async def fetch_quote(ft_session, symbol, max_age=None):
+    """
+    Retrieves the quote record for a symbol, using the session quote cache.
+
+    Args:
+        ft_session (AsyncFTSession):
+            The session object used for making HTTP requests to Firstrade.
+        symbol (str): The symbol for which the quote information is retrieved.
+        max_age (float, optional): Maximum age in seconds of a quote served from
+            the session quote cache. Use 0 to force a fresh quote.
+            Defaults to the cache ttl of the session.
+
+    Returns:
+        Quote: The quote for the symbol.
+    """
+    quote = ft_session.quote_cache.get(symbol, max_age)
+    if quote is None:
+        symbol_data = await ft_session.get(
+            url=urls.quote(symbol), headers=urls.session_headers()
+        )
+        quote = parse_quote(symbol_data.content)
+        ft_session.quote_cache.put(symbol, quote)
+    return quote
+
+
+async def get_quotes(ft_session, symbols, max_workers=8, max_age=None):
+    """
+    Retrieves quotes for many symbols concurrently.
+
+    Args:
+        ft_session (AsyncFTSession):
+            The session object used for making HTTP requests to Firstrade.
+        symbols (list): The symbols to retrieve quotes for.
+        max_workers (int, optional): Maximum number of concurrent requests.
+                                     Defaults to 8.
+        max_age (float, optional): Maximum age in seconds of quotes served from
+                                   the session quote cache. Defaults to the cache ttl.
+
+    Returns:
+        dict: Dictionary with the requested symbols as keys and either a
+        Quote or the exception raised while quoting that symbol as values.
+    """
+    symbols = list(dict.fromkeys(symbols))
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def fetch(symbol):
+        async with semaphore:
+            return await fetch_quote(ft_session, symbol, max_age)
+
+    results = await asyncio.gather(
+        *(fetch(symbol) for symbol in symbols), return_exceptions=True
+    )
+    return dict(zip(symbols, results))
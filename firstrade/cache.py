@@ -0,0 +1,113 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class QuoteCache:
+    """
+    Thread-safe cache of parsed quotes keyed by symbol.
+
+    Entries expire after a time to live and the least recently used
+    entry is evicted once the cache is full.
+
+    Attributes:
+        ttl (float): Default maximum age of a cached quote in seconds.
+        max_size (int): Maximum number of symbols kept in the cache.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that were missing or too old.
+        evictions (int): Number of entries dropped because the cache was full.
+    """
+
+    def __init__(self, ttl=0, max_size=256):
+        """
+        Initializes a new instance of the QuoteCache class.
+
+        Args:
+            ttl (float, optional): Default maximum age of a cached quote in seconds.
+                                   Defaults to 0, which never serves cached quotes.
+            max_size (int, optional): Maximum number of symbols kept. Defaults to 256.
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, symbol, max_age=None):
+        """
+        Gets a cached quote if it is recent enough.
+
+        Args:
+            symbol (str): The symbol to look up.
+            max_age (float, optional): Maximum age in seconds for this lookup.
+                                       Defaults to the cache ttl.
+
+        Returns:
+            The cached quote, or None if there is no fresh entry.
+        """
+        if max_age is None:
+            max_age = self.ttl
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry is None or time.monotonic() - entry[0] >= max_age:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(symbol)
+            self.hits += 1
+            return entry[1]
+
+    def peek(self, symbol):
+        """
+        Gets a cached quote of any age without touching the counters or LRU order.
+
+        Useful for fields that rarely change, like whether a symbol is fractional.
+
+        Args:
+            symbol (str): The symbol to look up.
+
+        Returns:
+            The cached quote, or None if the symbol is not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(symbol)
+            return None if entry is None else entry[1]
+
+    def put(self, symbol, quote):
+        """
+        Stores a freshly retrieved quote.
+
+        Args:
+            symbol (str): The symbol the quote is for.
+            quote: The parsed quote.
+        """
+        with self._lock:
+            self._entries[symbol] = (time.monotonic(), quote)
+            self._entries.move_to_end(symbol)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Removes all cached quotes."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Gets the cache counters.
+
+        Returns:
+            dict: The hits, misses, evictions and current size of the cache.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+            }
+
+    def __len__(self):
+        return len(self._entries)
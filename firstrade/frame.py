@@ -0,0 +1,145 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from firstrade.account import FTSession
+from firstrade.symbols import get_quotes
+
+
+class QuoteFrame:
+    """
+    Columnar snapshot of quotes for many symbols backed by NumPy arrays.
+
+    Every column is an array with one row per symbol, in the order of
+    :attr:`symbols`. Rows of symbols that could not be quoted hold NaN
+    in the price columns and 0 in the size columns.
+    NumPy is an optional dependency: pip install firstrade[numpy]
+
+    Attributes:
+        symbols (list): The symbols of the rows.
+        index (dict): Row number of every symbol.
+        bid, ask, last, change, high, low (numpy.ndarray): Float price columns.
+        bid_size, ask_size, last_size, volume (numpy.ndarray): Integer size columns.
+        valid (numpy.ndarray): Boolean column, True for rows that hold a quote.
+        errors (dict): The exception raised for every symbol that failed to quote.
+    """
+
+    PRICE_FIELDS = ("bid", "ask", "last", "change", "high", "low")
+    SIZE_FIELDS = ("bid_size", "ask_size", "last_size", "volume")
+
+    def __init__(self, symbols):
+        """
+        Initializes an empty QuoteFrame for the given symbols.
+
+        Args:
+            symbols (list): The symbols of the rows.
+        """
+        if np is None:
+            raise ImportError(
+                "QuoteFrame requires numpy. Install it with: pip install firstrade[numpy]"
+            )
+        self.symbols = list(dict.fromkeys(symbols))
+        self.index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        rows = len(self.symbols)
+        for field in self.PRICE_FIELDS:
+            setattr(self, field, np.full(rows, np.nan))
+        for field in self.SIZE_FIELDS:
+            setattr(self, field, np.zeros(rows, dtype=np.int64))
+        self.valid = np.zeros(rows, dtype=bool)
+        self.errors = {}
+
+    @classmethod
+    def from_quotes(cls, quotes):
+        """
+        Builds a QuoteFrame from quote records.
+
+        Args:
+            quotes (dict): Symbols mapped to a Quote, or to an exception
+                           as returned by get_quotes.
+
+        Returns:
+            QuoteFrame: The filled frame.
+        """
+        frame = cls(quotes)
+        for symbol, quote in quotes.items():
+            if isinstance(quote, Exception):
+                frame.errors[symbol] = quote
+            else:
+                frame.set_quote(symbol, quote)
+        return frame
+
+    def set_quote(self, symbol, quote):
+        """
+        Fills the row of a symbol from a quote record.
+
+        Args:
+            symbol (str): The symbol of the row.
+            quote (Quote): The quote to store.
+        """
+        row = self.index[symbol]
+        for field in self.PRICE_FIELDS:
+            value = getattr(quote, field)
+            getattr(self, field)[row] = np.nan if value is None else value
+        for field in self.SIZE_FIELDS:
+            getattr(self, field)[row] = getattr(quote, field)
+        self.valid[row] = True
+
+    @property
+    def spread(self):
+        """numpy.ndarray: Ask minus bid of every row."""
+        return self.ask - self.bid
+
+    @property
+    def mid(self):
+        """numpy.ndarray: Midpoint of bid and ask of every row."""
+        return (self.bid + self.ask) / 2
+
+    @property
+    def percent_change(self):
+        """numpy.ndarray: Change of every row as a percentage of the previous close."""
+        previous_close = self.last - self.change
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(
+                previous_close != 0, self.change / previous_close * 100, np.nan
+            )
+
+    def row(self, symbol):
+        """
+        Gets the values of a single symbol.
+
+        Args:
+            symbol (str): The symbol to look up.
+
+        Returns:
+            dict: The value of every column for the symbol.
+        """
+        row = self.index[symbol]
+        return {
+            field: getattr(self, field)[row].item()
+            for field in self.PRICE_FIELDS + self.SIZE_FIELDS
+        }
+
+    def __len__(self):
+        return len(self.symbols)
+
+
+def get_quote_frame(ft_session: FTSession, symbols, max_workers=8, max_age=None):
+    """
+    Retrieves quotes for many symbols concurrently into a QuoteFrame.
+
+    Args:
+        ft_session (FTSession):
+            The session object used for making HTTP requests to Firstrade.
+        symbols (list): The symbols to retrieve quotes for.
+        max_workers (int, optional): Maximum number of concurrent requests.
+                                     Defaults to 8.
+        max_age (float, optional): Maximum age in seconds of quotes served from
+                                   the session quote cache. Defaults to the cache ttl.
+
+    Returns:
+        QuoteFrame: The quotes of the symbols, one row per symbol.
+    """
+    return QuoteFrame.from_quotes(
+        get_quotes(ft_session, symbols, max_workers=max_workers, max_age=max_age)
+    )
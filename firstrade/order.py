@@ -1,9 +1,15 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from typing import NamedTuple, Optional
+from urllib.parse import urlencode
 
 from bs4 import BeautifulSoup
+from lxml import etree, html
 
 from firstrade import urls
 from firstrade.account import FTSession
+from firstrade.utils import parse_xml
 
 
 class PriceType(str, Enum):
@@ -65,6 +71,7 @@ class Order:
     def __init__(self, ft_session: FTSession):
         self.ft_session = ft_session
         self.order_confirmation = {}
+        self.order_confirmations = []
 
     def place_order(
         self,
@@ -78,6 +85,7 @@ class Order:
         dry_run=True,
         notional=False,
         order_instruction: OrderInstructions = None,
+        skip_preview=False,
     ):
         """
         Builds and places an order.
@@ -93,109 +101,512 @@ class Order:
             price (float, optional): The price to buy the shares at. Defaults to 0.00.
             dry_run (bool, optional): Whether you want the order to be placed or not.
                                       Defaults to True.
+            skip_preview (bool, optional): Whether to submit the order directly, without
+                a preview first, saving a round trip. If the direct submit is rejected
+                with a warning, the order goes through the usual preview and submit.
+                Ignored for dry runs. Defaults to False.
 
         Returns:
             Order:order_confirmation: Dictionary containing the order confirmation data.
         """
 
-        if price_type == PriceType.MARKET:
-            price = ""
-        if order_instruction == OrderInstructions.AON and price_type != PriceType.LIMIT:
-            raise ValueError("AON orders must be a limit order.")
-        if order_instruction == OrderInstructions.AON and quantity <= 100:
-            raise ValueError("AON orders must be greater than 100 shares.")
-
-        data = {
-            "submiturl": "/cgi-bin/orderbar",
-            "orderbar_clordid": "",
-            "orderbar_accountid": "",
-            "notional": "yes" if notional else "",
-            "stockorderpage": "yes",
-            "submitOrders": "",
-            "previewOrders": "1",
-            "lotMethod": "1",
-            "accountType": "1",
-            "quoteprice": "",
-            "viewederror": "",
-            "stocksubmittedcompanyname1": "",
-            "accountId": account,
-            "transactionType": order_type,
-            "quantity": quantity,
-            "symbol": symbol,
-            "priceType": price_type,
-            "limitPrice": price,
-            "duration": duration,
-            "qualifier": "0" if order_instruction is None else order_instruction,
-            "cond_symbol0_0": "",
-            "cond_type0_0": "2",
-            "cond_compare_type0_0": "2",
-            "cond_compare_value0_0": "",
-            "cond_and_or0": "1",
-            "cond_symbol0_1": "",
-            "cond_type0_1": "2",
-            "cond_compare_type0_1": "2",
-            "cond_compare_value0_1": "",
-        }
+        data = build_order_data(
+            account,
+            symbol,
+            price_type,
+            order_type,
+            quantity,
+            duration,
+            price,
+            notional,
+            order_instruction,
+            cached_fractional(self.ft_session, symbol),
+        )
+        if skip_preview and not dry_run:
+            order_confirmation = self._submit(data, None)
+            # only a warning is worth a preview, a hard rejection stays rejected
+            if (
+                order_confirmation["success"] != "No"
+                or "warning" not in order_confirmation
+            ):
+                self.order_confirmation = order_confirmation
+                return order_confirmation
+
+        order_confirmation = self._preview(data)
+        if not dry_run and order_confirmation["success"] != "No":
+            order_confirmation = self._submit(data, order_confirmation.get("warning"))
+        self.order_confirmation = order_confirmation
+        return order_confirmation
+
+    def place_orders(self, batch, dry_run=True, max_workers=4, approve=None):
+        """
+        Previews and places many orders concurrently.
+
+        All orders are previewed first, and the warnings of the whole batch are
+        passed to approve at once. The approved orders are then submitted.
+        :attr: 'order_confirmations` contains the results afterwards, and
+        :attr: 'order_confirmation` is left unchanged.
+
+        Args:
+            batch (list): One dict of order arguments per order: account, symbol,
+                price_type, order_type, quantity, duration and optionally price,
+                notional and order_instruction, named as in place_order.
+            dry_run (bool, optional): Whether you want the orders to be placed or not.
+                                      Defaults to True.
+            max_workers (int, optional): Maximum number of concurrent requests.
+                                         Defaults to 4.
+            approve (callable, optional): Called with a dict of batch index to warning
+                message for every order that got a warning, it returns the indexes
+                of the orders that may still be submitted. Orders without a warning
+                are always submitted. Defaults to submitting every order.
+
+        Returns:
+            list: In batch order, the order confirmation dict of each order, or the
+            exception raised while placing it. Orders whose preview was rejected or
+            whose warning was not approved get their preview confirmation.
+
+        Raises:
+            ValueError: If an order has other arguments or breaks the ORDER_RULES.
+        """
+        orders = build_batch_data(self.ft_session, batch)
+        results = [None] * len(orders)
+        if not orders:
+            self.order_confirmations = results
+            return results
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(orders))) as executor:
+            previews = [executor.submit(self._preview, data) for data in orders]
+            warnings = {}
+            for i, future in enumerate(previews):
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    results[i] = e
+                    continue
+                if results[i].get("warning"):
+                    warnings[i] = results[i]["warning"]
+            approved = set(warnings) if approve is None else set(approve(warnings))
+
+            submits = {}
+            for i, data in enumerate(orders):
+                if isinstance(results[i], Exception) or results[i]["success"] == "No":
+                    continue
+                if dry_run or (i in warnings and i not in approved):
+                    continue
+                submits[i] = executor.submit(self._submit, data, warnings.get(i))
+            for i, future in submits.items():
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    results[i] = e
+        self.order_confirmations = results
+        return results
+
+    def _preview(self, data):
+        """
+        Sends an order preview.
+
+        Args:
+            data (dict): The order fields returned by build_order_data.
+
+        Returns:
+            dict: The parsed preview, including its warning if it has one.
+        """
+        order_response = self.ft_session.post(
+            url=urls.orderbar(),
+            headers=urls.order_headers(),
+            data=ORDER_FORM.encode(data),
+        ).content
+        return parse_orderbar(order_response)
+
+    def _submit(self, data, warning):
+        """
+        Submits a previewed order.
+
+        Args:
+            data (dict): The order fields returned by build_order_data.
+            warning (str): The warning of the preview, or None.
+
+        Returns:
+            dict: The parsed submit confirmation, led by the preview warning if any.
+        """
+        order_response = self.ft_session.post(
+            url=urls.orderbar(),
+            headers=urls.order_headers(),
+            data=ORDER_FORM.encode(data, submit=True, viewed_error=warning),
+        ).content
+        order_confirmation = {"warning": warning} if warning else {}
+        order_confirmation.update(parse_orderbar(order_response, dry_run=False))
+        return order_confirmation
+
+
+def build_order_data(
+    account,
+    symbol,
+    price_type: PriceType,
+    order_type: OrderType,
+    quantity,
+    duration: Duration,
+    price=0.00,
+    notional=False,
+    order_instruction: OrderInstructions = None,
+    fractional=None,
+):
+    """
+    Validates an order and builds the orderbar form fields that change per order.
 
-        order_data = BeautifulSoup(
-            self.ft_session.post(
-                url=urls.orderbar(), headers=urls.session_headers(), data=data
-            ).text,
-            "xml",
+    Args:
+        account (str): Account number of the account to place the order in.
+        symbol (str): Ticker to place the order for.
+        price_type (PriceType): Price Type i.e. LIMIT, MARKET, STOP, etc.
+        order_type (OrderType): Order Type i.e. BUY, SELL, etc.
+        quantity (float): The number of shares to buy.
+        duration (Duration): Duration of the order i.e. DAY, GT90, etc.
+        price (float, optional): The price to buy the shares at. Defaults to 0.00.
+        notional (bool, optional): Whether quantity is a dollar amount. Defaults to False.
+        order_instruction (OrderInstructions, optional): Order instruction i.e. AON.
+        fractional (bool, optional): Whether the symbol can be traded fractionally,
+                                     None if unknown. Defaults to None.
+
+    Returns:
+        dict: The order fields, to be encoded with ORDER_FORM.
+
+    Raises:
+        ValueError: If the order breaks one of the ORDER_RULES.
+    """
+    validate_order(
+        OrderSpec(
+            symbol,
+            price_type,
+            order_type,
+            _order_quantity(quantity),
+            duration,
+            price,
+            notional,
+            order_instruction,
+            fractional,
         )
-        order_confirmation = {}
-        cdata = order_data.find("actiondata").string
-        cdata_soup = BeautifulSoup(cdata, "html.parser")
-        span = (
-            cdata_soup.find("div", class_="msg_bg")
-            .find("div", class_="yellow box")
-            .find("div", class_="error_msg")
-            .find("div", class_="outbox")
-            .find("div", class_="inbox")
-            .find("span")
+    )
+    if price_type == PriceType.MARKET:
+        price = ""
+
+    return {
+        "accountId": account,
+        "transactionType": _form_value(order_type),
+        "quantity": quantity,
+        "symbol": symbol,
+        "priceType": _form_value(price_type),
+        "limitPrice": price,
+        "duration": _form_value(duration),
+        "qualifier": (
+            "0" if order_instruction is None else _form_value(order_instruction)
+        ),
+        "notional": "yes" if notional else "",
+    }
+
+
+def _form_value(value):
+    # urlencode formats str enums by name, the form needs their value
+    return value.value if isinstance(value, Enum) else value
+
+
+class OrderTemplate:
+    """
+    Orderbar form with its constant fields url encoded once.
+
+    Only the fields of the order itself are encoded per request, the preview
+    and submit flags are picked from pre-encoded variants.
+    """
+
+    def __init__(self, constant_fields):
+        """
+        Initializes a new instance of the OrderTemplate class.
+
+        Args:
+            constant_fields (dict): The form fields that are the same for every order.
+        """
+        self.constant_fields = dict(constant_fields)
+        self._constant = urlencode(self.constant_fields).encode()
+        self._steps = {
+            (submit, viewed_error): urlencode(
+                {
+                    "previewOrders": "" if submit else "1",
+                    "submitOrders": "1" if submit else "",
+                    "viewederror": "1" if viewed_error else "",
+                }
+            ).encode()
+            for submit in (False, True)
+            for viewed_error in (False, True)
+        }
+
+    def encode(self, data, submit=False, viewed_error=False):
+        """
+        Encodes the form body of an order.
+
+        Args:
+            data (dict): The order fields returned by build_order_data.
+            submit (bool, optional): Whether to submit the order instead of previewing
+                                     it. Defaults to False.
+            viewed_error (bool, optional): Whether the warning of the preview was
+                                           seen. Defaults to False.
+
+        Returns:
+            bytes: The url encoded body to post to orderbar with urls.order_headers.
+        """
+        return b"&".join(
+            (
+                self._constant,
+                self._steps[submit, bool(viewed_error)],
+                urlencode(data).encode(),
+            )
         )
-        if span:
-            order_warning = span.text.strip()
-            order_confirmation["warning"] = order_warning
-            data["viewederror"] = "1"
-        if not dry_run:
-            data["previewOrders"] = ""
-            data["submitOrders"] = "1"
-            order_data = BeautifulSoup(
-                self.ft_session.post(
-                    url=urls.orderbar(), headers=urls.session_headers(), data=data
-                ).text,
-                "xml",
+
+
+ORDER_FORM = OrderTemplate(
+    {
+        "submiturl": "/cgi-bin/orderbar",
+        "orderbar_clordid": "",
+        "orderbar_accountid": "",
+        "stockorderpage": "yes",
+        "lotMethod": "1",
+        "accountType": "1",
+        "quoteprice": "",
+        "stocksubmittedcompanyname1": "",
+        "cond_symbol0_0": "",
+        "cond_type0_0": "2",
+        "cond_compare_type0_0": "2",
+        "cond_compare_value0_0": "",
+        "cond_and_or0": "1",
+        "cond_symbol0_1": "",
+        "cond_type0_1": "2",
+        "cond_compare_type0_1": "2",
+        "cond_compare_value0_1": "",
+    }
+)
+
+
+# the place_order arguments a batch order may have
+BATCH_ORDER_FIELDS = (
+    "account",
+    "symbol",
+    "price_type",
+    "order_type",
+    "quantity",
+    "duration",
+    "price",
+    "notional",
+    "order_instruction",
+)
+
+
+def build_batch_data(ft_session, batch):
+    """
+    Validates the orders of a batch and builds their orderbar form fields.
+
+    Args:
+        ft_session (FTSession): The session whose quote cache is used.
+        batch (list): One dict of BATCH_ORDER_FIELDS per order.
+
+    Returns:
+        list: The order fields of each order, see build_order_data.
+
+    Raises:
+        ValueError: If an order has other arguments or breaks the ORDER_RULES.
+    """
+    orders = []
+    for i, order in enumerate(batch):
+        unknown = [name for name in order if name not in BATCH_ORDER_FIELDS]
+        if unknown:
+            raise ValueError(
+                f"Order {i} of the batch has arguments place_orders does not take "
+                f"per order: {', '.join(unknown)}."
             )
+        orders.append(
+            build_order_data(
+                **order, fractional=cached_fractional(ft_session, order["symbol"])
+            )
+        )
+    return orders
 
-        order_success = order_data.find("success").text.strip()
-        order_confirmation["success"] = order_success
-        action_data = order_data.find("actiondata").text.strip()
-        if order_success != "No":
-            # Extract the table data
-            table_start = action_data.find("<table")
-            table_end = action_data.find("</table>") + len("</table>")
-            table_data = action_data[table_start:table_end]
-            table_data = BeautifulSoup(table_data, "xml")
-            titles = table_data.find_all("th")
-            data = table_data.find_all("td")
-            for i, title in enumerate(titles):
-                order_confirmation[f"{title.get_text()}"] = data[i].get_text()
-            if not dry_run:
-                start_index = action_data.find(
-                    "Your order reference number is: "
-                ) + len("Your order reference number is: ")
-                end_index = action_data.find("</div>", start_index)
-                order_number = action_data[start_index:end_index]
-            else:
-                start_index = action_data.find('id="') + len('id="')
-                end_index = action_data.find('" style=', start_index)
-                order_number = action_data[start_index:end_index]
-            order_confirmation["orderid"] = order_number
-        else:
-            order_confirmation["actiondata"] = action_data
-        order_confirmation["errcode"] = order_data.find("errcode").text.strip()
-        self.order_confirmation = order_confirmation
+
+def cached_fractional(ft_session, symbol):
+    """
+    Looks up whether a symbol can be traded fractionally in the session quote cache.
+
+    Args:
+        ft_session (FTSession): The session whose quote cache is used.
+        symbol (str): The symbol to look up.
+
+    Returns:
+        bool: The fractional flag of the cached quote, or None if it is not cached.
+    """
+    quote = ft_session.quote_cache.peek(symbol)
+    return None if quote is None else quote.fractional
+
+
+def _order_quantity(quantity):
+    """Converts the quantity of an order to a float for the ORDER_RULES."""
+    try:
+        return float(quantity)
+    except (TypeError, ValueError):
+        raise ValueError(f"Quantity must be a number, got {quantity!r}.") from None
+
+
+class OrderSpec(NamedTuple):
+    """The parameters of an order that the ORDER_RULES check."""
+
+    symbol: str
+    price_type: PriceType
+    order_type: OrderType
+    quantity: float
+    duration: Duration
+    price: float
+    notional: bool
+    order_instruction: OrderInstructions
+    fractional: Optional[bool]
+
+
+def _aon_is_limit(order):
+    if (
+        order.order_instruction == OrderInstructions.AON
+        and order.price_type != PriceType.LIMIT
+    ):
+        return "AON orders must be a limit order."
+    return None
+
+
+def _aon_over_100_shares(order):
+    if order.order_instruction == OrderInstructions.AON and order.quantity <= 100:
+        return "AON orders must be greater than 100 shares."
+    return None
+
+
+def _positive_quantity(order):
+    if order.quantity <= 0:
+        return "Quantity must be greater than 0."
+    return None
+
+
+def _price_given(order):
+    if order.price_type in (PriceType.LIMIT, PriceType.STOP, PriceType.STOP_LIMIT) and (
+        not order.price or float(order.price) <= 0
+    ):
+        return "Limit and stop orders must have a price greater than 0."
+    return None
+
+
+def _notional_is_market(order):
+    if order.notional and order.price_type != PriceType.MARKET:
+        return "Notional orders must be a market order."
+    return None
+
+
+def _extended_hours_is_limit(order):
+    if (
+        order.duration in (Duration.PRE_MARKET, Duration.AFTER_MARKET, Duration.DAY_EXT)
+        and order.price_type != PriceType.LIMIT
+    ):
+        return "Pre-market and after-market orders must be a limit order."
+    return None
+
+
+def _fractional_allowed(order):
+    if order.fractional is not False:
+        return None
+    if order.notional:
+        return f"{order.symbol} can not be traded fractionally, so notional orders are not allowed."
+    if order.quantity != int(order.quantity):
+        return f"{order.symbol} can not be traded fractionally, the quantity must be whole shares."
+    return None
+
+
+# each rule returns an error message for an invalid order, or None
+ORDER_RULES = [
+    _aon_is_limit,
+    _aon_over_100_shares,
+    _positive_quantity,
+    _price_given,
+    _notional_is_market,
+    _extended_hours_is_limit,
+    _fractional_allowed,
+]
+
+
+def validate_order(order: OrderSpec, rules=None):
+    """
+    Checks an order locally before it is sent to Firstrade.
+
+    Args:
+        order (OrderSpec): The order to check.
+        rules (list, optional): Functions taking the OrderSpec and returning an
+                                error message or None. Defaults to ORDER_RULES.
+
+    Raises:
+        ValueError: With the messages of every broken rule.
+    """
+    errors = [
+        error
+        for error in (rule(order) for rule in (ORDER_RULES if rules is None else rules))
+        if error
+    ]
+    if errors:
+        raise ValueError(" ".join(errors))
+
+
+_ORDER_NUMBER = re.compile(r"Your order reference number is: ([^<]*)")
+_PREVIEW_ID = re.compile(r'id="([^"]*)" style=')
+# the warning is only the span in the inbox of the error box
+_WARNING_SPAN = (
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' error_msg ')]"
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' inbox ')]//span"
+)
+
+
+def parse_orderbar(xml_string, dry_run=True):
+    """
+    Parses an orderbar preview or submit response in a single pass.
+
+    The response envelope is read with lxml, and the HTML in its actiondata
+    is parsed once for the warning and the order table.
+
+    Args:
+        xml_string (str or bytes): The XML returned by orderbar.
+        dry_run (bool, optional): Whether the response is for a preview
+                                  rather than a submitted order. Defaults to True.
+
+    Returns:
+        dict: The warning if the order has one, the success flag, the order table
+        fields, the order id or the error message, and the error code.
+    """
+    try:
+        root = parse_xml(xml_string)
+        envelope = {element.tag: element.text or "" for element in root}
+    except etree.XMLSyntaxError:
+        root = BeautifulSoup(xml_string, "xml").find("response")
+        envelope = {
+            element.name: element.text for element in root.find_all(recursive=False)
+        }
+    success = envelope.get("success", "").strip()
+    action_data = envelope.get("actiondata", "").strip()
+
+    order_confirmation = {}
+    fragment = html.fromstring(f"<div>{action_data}</div>")
+    span = fragment.xpath(_WARNING_SPAN)
+    if span and span[0].text_content().strip():
+        order_confirmation["warning"] = span[0].text_content().strip()
+    order_confirmation["success"] = success
+    if success != "No":
+        table = fragment.find(".//table")
+        if table is not None:
+            titles = table.iter("th")
+            data = table.iter("td")
+            for title, value in zip(titles, data):
+                order_confirmation[title.text_content()] = value.text_content()
+        order_number = (_PREVIEW_ID if dry_run else _ORDER_NUMBER).search(action_data)
+        order_confirmation["orderid"] = order_number.group(1) if order_number else ""
+    else:
+        order_confirmation["actiondata"] = action_data
+    order_confirmation["errcode"] = envelope.get("errcode", "").strip()
+    return order_confirmation
 
 
 def get_orders(ft_session, account):
@@ -220,6 +631,20 @@ def get_orders(ft_session, account):
         url=urls.order_list(), headers=urls.session_headers(), data=data
     ).text
 
+    return parse_orders(response)
+
+
+def parse_orders(response):
+    """
+    Parses the order status page.
+
+    Args:
+        response (str): The HTML returned by the order status endpoint.
+
+    Returns:
+        list: A list of dictionaries, each containing details about an order.
+    """
+
     # Parse the response using BeautifulSoup
     soup = BeautifulSoup(response, "html.parser")
 
@@ -0,0 +1,218 @@
+import asyncio
+import bisect
+import itertools
+import threading
+import time
+
+from firstrade import urls
+
+ORDERS = "orders"
+ACCOUNT = "account"
+QUOTES = "quotes"
+
+# lower values are served first
+PRIORITIES = {ORDERS: 0, ACCOUNT: 1, QUOTES: 2}
+
+
+def endpoint_class(url):
+    """
+    Gets the endpoint class of a Firstrade URL.
+
+    Args:
+        url (str): The URL of the request.
+
+    Returns:
+        str: ORDERS, QUOTES or ACCOUNT.
+    """
+    if url.startswith(urls.orderbar()):
+        return ORDERS
+    if url.startswith(urls.get_xml()) and "page=quo" in url:
+        return QUOTES
+    return ACCOUNT
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at a fixed rate.
+
+    It is not thread-safe on its own; RequestScheduler guards it with its lock.
+    """
+
+    def __init__(self, rate, capacity=None):
+        """
+        Initializes a new instance of the TokenBucket class.
+
+        Args:
+            rate (float): Tokens added per second.
+            capacity (float, optional): Maximum number of tokens, i.e. the burst size.
+                                        Defaults to one second worth of tokens, at least 1.
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now):
+        """Adds the tokens earned since the last refill."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def ready(self):
+        """Checks if a token is available."""
+        return self.tokens >= 1
+
+    def take(self):
+        """Takes a token."""
+        self.tokens -= 1
+
+    def time_to_token(self):
+        """Gets the seconds until a token is available."""
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+
+class RequestScheduler:
+    """
+    Client-side rate limiter with a budget per endpoint class and a priority queue.
+
+    Each endpoint class (orders, account data, quotes) can have its own
+    token bucket, and an optional total bucket caps all requests together.
+    Waiting requests take tokens of the total budget in priority order,
+    so order traffic goes ahead of queued quote polls.
+    """
+
+    def __init__(self, limits=None, total=None, priorities=None):
+        """
+        Initializes a new instance of the RequestScheduler class.
+
+        Args:
+            limits (dict, optional): Endpoint class mapped to a (rate, burst) tuple,
+                e.g. {QUOTES: (5, 10)}. Classes without a limit are not limited.
+            total (tuple, optional): (rate, burst) shared by all endpoint classes.
+            priorities (dict, optional): Endpoint class mapped to its priority,
+                lower first. Defaults to orders, then account data, then quotes.
+        """
+        self.buckets = {
+            name: TokenBucket(rate, burst)
+            for name, (rate, burst) in (limits or {}).items()
+        }
+        self.total = TokenBucket(*total) if total is not None else None
+        self.priorities = priorities if priorities is not None else dict(PRIORITIES)
+        self._condition = threading.Condition()
+        self._waiters = []
+        self._counter = itertools.count()
+
+    def acquire(self, endpoint, timeout=None):
+        """
+        Waits until a request of the given endpoint class may be sent.
+
+        Args:
+            endpoint (str): The endpoint class of the request.
+            timeout (float, optional): Seconds to wait before raising TimeoutError.
+                                       Defaults to waiting forever.
+        """
+        waiter = self._waiter(endpoint)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            bisect.insort(self._waiters, waiter)
+            try:
+                while True:
+                    wait = self._try_take(waiter, deadline)
+                    if wait is None:
+                        return
+                    self._condition.wait(wait)
+            finally:
+                self._waiters.remove(waiter)
+                self._condition.notify_all()
+
+    async def acquire_async(self, endpoint, timeout=None):
+        """
+        Waits until a request of the given endpoint class may be sent, without
+        blocking the event loop.
+
+        The request joins the same priority queue as acquire() right away,
+        and sleeps on the event loop until it is its turn.
+
+        Args:
+            endpoint (str): The endpoint class of the request.
+            timeout (float, optional): Seconds to wait before raising TimeoutError.
+                                       Defaults to waiting forever.
+        """
+        waiter = self._waiter(endpoint)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            bisect.insort(self._waiters, waiter)
+        try:
+            while True:
+                with self._condition:
+                    wait = self._try_take(waiter, deadline)
+                if wait is None:
+                    return
+                await asyncio.sleep(wait)
+        finally:
+            with self._condition:
+                self._waiters.remove(waiter)
+                self._condition.notify_all()
+
+    def _waiter(self, endpoint):
+        """Gets the queue entry of a request, ordered by priority then arrival."""
+        return (
+            self.priorities.get(endpoint, len(self.priorities)),
+            next(self._counter),
+            endpoint,
+        )
+
+    def _try_take(self, waiter, deadline):
+        """
+        Takes the tokens of a queued request if it is its turn.
+
+        Must be called with the lock held.
+
+        Returns:
+            float: None if the tokens were taken, else the seconds to wait before
+            trying again.
+
+        Raises:
+            TimeoutError: If the deadline passed.
+        """
+        now = time.monotonic()
+        self._refill(now)
+        endpoint = waiter[2]
+        if self._next_ready() == waiter and (self.total is None or self.total.ready()):
+            if endpoint in self.buckets:
+                self.buckets[endpoint].take()
+            if self.total is not None:
+                self.total.take()
+            return None
+        wait = self._wait_time()
+        if deadline is not None:
+            if now >= deadline:
+                raise TimeoutError(f"Timed out waiting to send a {endpoint} request")
+            wait = min(wait, deadline - now)
+        return wait
+
+    def _refill(self, now):
+        """Refills every bucket."""
+        for bucket in self.buckets.values():
+            bucket.refill(now)
+        if self.total is not None:
+            self.total.refill(now)
+
+    def _next_ready(self):
+        """Gets the highest priority waiter whose endpoint budget has a token."""
+        for waiter in self._waiters:
+            bucket = self.buckets.get(waiter[2])
+            if bucket is None or bucket.ready():
+                return waiter
+        return None
+
+    def _wait_time(self):
+        """Gets the seconds until the next token of any waiting budget."""
+        times = [
+            self.buckets[waiter[2]].time_to_token()
+            for waiter in self._waiters
+            if waiter[2] in self.buckets
+        ]
+        if self.total is not None:
+            times.append(self.total.time_to_token())
+        times = [t for t in times if t > 0]
+        return min(times) if times else 0.01
@@ -0,0 +1,222 @@
+import json
+import os
+import tempfile
+import time
+from abc import ABC, abstractmethod
+
+import requests
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+class SessionStore(ABC):
+    """
+    Interface for storing login cookies shared by many sessions.
+
+    A store persists the cookies of each user and provides a lock per user,
+    so only one process performs the login while the others wait and then
+    adopt the saved cookies. Subclass it to keep sessions somewhere else
+    than local files.
+    """
+
+    @abstractmethod
+    def load(self, username):
+        """
+        Loads the saved cookies of a user.
+
+        Args:
+            username (str): Firstrade login username.
+
+        Returns:
+            RequestsCookieJar: The saved cookies, empty if none were saved.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, username, cookies):
+        """
+        Saves the cookies of a user.
+
+        Args:
+            username (str): Firstrade login username.
+            cookies (CookieJar): The cookies to save.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, username):
+        """
+        Deletes the saved cookies of a user.
+
+        Args:
+            username (str): Firstrade login username.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def lock(self, username):
+        """
+        Gets the lock guarding the login of a user.
+
+        Args:
+            username (str): Firstrade login username.
+
+        Returns:
+            A lock with acquire() and release() that is also a context manager.
+        """
+        raise NotImplementedError
+
+
+class FileSessionStore(SessionStore):
+    """
+    Session store keeping the cookies in JSON files in a profile directory.
+
+    The login lock is an exclusive lock on a file next to the cookie file,
+    so it works across processes on the same host.
+    """
+
+    def __init__(self, profile_path=None, lock_timeout=None):
+        """
+        Initializes a new instance of the FileSessionStore class.
+
+        Args:
+            profile_path (str, optional): Directory of the cookie files.
+                                          Defaults to the working directory.
+            lock_timeout (float, optional): Seconds to wait for the login lock
+                                            before giving up. Defaults to waiting forever.
+        """
+        self.profile_path = profile_path
+        self.lock_timeout = lock_timeout
+
+    def path(self, username):
+        """Gets the path of the cookie file of a user."""
+        if self.profile_path is not None:
+            return os.path.join(self.profile_path, f"ft_cookies{username}.json")
+        return f"ft_cookies{username}.json"
+
+    def load(self, username):
+        jar = requests.cookies.RequestsCookieJar()
+        try:
+            with open(self.path(username), "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return jar
+        now = time.time()
+        for cookie in saved.get("cookies", []):
+            if cookie.get("expires") is not None and cookie["expires"] <= now:
+                continue
+            jar.set_cookie(
+                requests.cookies.create_cookie(
+                    cookie["name"],
+                    cookie["value"],
+                    domain=cookie.get("domain", ""),
+                    path=cookie.get("path", "/"),
+                    expires=cookie.get("expires"),
+                    secure=cookie.get("secure", False),
+                    rest=cookie.get("rest", {}),
+                )
+            )
+        return jar
+
+    def save(self, username, cookies):
+        # write to a temporary file and rename it, so readers never see a partial file
+        path = self.path(username)
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        saved = {
+            "version": 1,
+            "cookies": [
+                {
+                    "name": cookie.name,
+                    "value": cookie.value,
+                    "domain": cookie.domain,
+                    "path": cookie.path,
+                    "expires": cookie.expires,
+                    "secure": cookie.secure,
+                    "rest": cookie._rest,
+                }
+                for cookie in cookies
+            ],
+        }
+        fd, temp_path = tempfile.mkstemp(
+            dir=directory, prefix=".ft_cookies", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(saved, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def delete(self, username):
+        os.remove(self.path(username))
+
+    def lock(self, username):
+        return FileLock(f"{self.path(username)}.lock", timeout=self.lock_timeout)
+
+
+class FileLock:
+    """Exclusive lock on a file, held across processes and threads."""
+
+    def __init__(self, path, timeout=None, poll_interval=0.05):
+        """
+        Initializes a new instance of the FileLock class.
+
+        Args:
+            path (str): Path of the lock file. It is created if missing.
+            timeout (float, optional): Seconds to wait for the lock before raising
+                                       TimeoutError. Defaults to waiting forever.
+            poll_interval (float, optional): Seconds between attempts. Defaults to 0.05.
+        """
+        self.path = path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._file = None
+
+    def acquire(self):
+        """Waits until the lock is free and takes it."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        lock_file = open(self.path, "a+")
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+                break
+            except OSError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    lock_file.close()
+                    raise TimeoutError(f"Timed out waiting for the lock on {self.path}")
+                time.sleep(self.poll_interval)
+        self._file = lock_file
+
+    def release(self):
+        """Releases the lock."""
+        lock_file, self._file = self._file, None
+        if lock_file is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            lock_file.close()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
@@ -0,0 +1,191 @@
+import threading
+import time
+from typing import NamedTuple
+
+from firstrade.account import FTSession
+from firstrade.symbols import Quote, get_quotes
+
+
+class QuoteEvent(NamedTuple):
+    """
+    A change in the quote of a symbol.
+
+    Attributes:
+        symbol (str): The symbol whose quote changed.
+        changes (dict): The changed fields mapped to (old value, new value).
+        quote (Quote): The latest quote for the symbol.
+    """
+
+    symbol: str
+    changes: dict
+    quote: Quote
+
+
+class QuoteStream:
+    """
+    Polls quotes for a set of symbols and reports only the fields that changed.
+
+    Symbols whose quote did not change are polled less often, backing off
+    from interval up to max_interval, and return to the base interval as
+    soon as they change again. Symbols whose quote fails are retried at the
+    base interval and the error is passed to the error subscribers.
+    """
+
+    FIELDS = ("bid", "ask", "last", "bid_size", "ask_size", "last_size")
+
+    def __init__(
+        self,
+        ft_session: FTSession,
+        symbols,
+        interval=1.0,
+        max_interval=30.0,
+        backoff=2.0,
+        fields=FIELDS,
+        max_workers=8,
+    ):
+        """
+        Initializes a new instance of the QuoteStream class.
+
+        Args:
+            ft_session (FTSession):
+                The session object used for making HTTP requests to Firstrade.
+            symbols (list): The symbols to watch.
+            interval (float, optional): Seconds between polls of an active symbol.
+                                        Defaults to 1.0.
+            max_interval (float, optional): Longest poll interval of an idle symbol.
+                                            Defaults to 30.0.
+            backoff (float, optional): Factor the interval of an idle symbol grows by
+                                       after each unchanged poll. Defaults to 2.0.
+            fields (tuple, optional): The quote fields to compare.
+                                      Defaults to bid, ask, last and their sizes.
+            max_workers (int, optional): Maximum number of concurrent quote requests.
+                                         Defaults to 8.
+        """
+        self.ft_session = ft_session
+        self.interval = interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.fields = tuple(fields)
+        self.max_workers = max_workers
+        self.callbacks = []
+        self.error_callbacks = []
+        self._last = {}
+        self._intervals = {}
+        self._next_poll = {}
+        self._stopped = threading.Event()
+        for symbol in symbols:
+            self.add_symbol(symbol)
+
+    def add_symbol(self, symbol):
+        """
+        Starts watching a symbol, polling it on the next poll.
+
+        Args:
+            symbol (str): The symbol to watch.
+        """
+        self._intervals[symbol] = self.interval
+        self._next_poll[symbol] = time.monotonic()
+
+    def remove_symbol(self, symbol):
+        """
+        Stops watching a symbol.
+
+        Args:
+            symbol (str): The symbol to stop watching.
+        """
+        self._intervals.pop(symbol, None)
+        self._next_poll.pop(symbol, None)
+        self._last.pop(symbol, None)
+
+    def subscribe(self, callback):
+        """
+        Registers a function that is called with every QuoteEvent.
+
+        Args:
+            callback (callable): Function taking a single QuoteEvent.
+        """
+        self.callbacks.append(callback)
+
+    def subscribe_errors(self, callback):
+        """
+        Registers a function that is called when the quote of a symbol fails.
+
+        Args:
+            callback (callable): Function taking the symbol and the exception raised.
+        """
+        self.error_callbacks.append(callback)
+
+    def poll(self):
+        """
+        Fetches the symbols that are due and reports their changes.
+
+        Returns:
+            list: A QuoteEvent for every due symbol whose quote changed.
+                  The first poll of a symbol reports all of its fields.
+        """
+        now = time.monotonic()
+        due = [symbol for symbol, at in self._next_poll.items() if at <= now]
+        if not due:
+            return []
+        quotes = get_quotes(
+            self.ft_session, due, max_workers=self.max_workers, max_age=0
+        )
+        events = []
+        errors = []
+        for symbol, quote in quotes.items():
+            if symbol not in self._next_poll:
+                continue
+            if isinstance(quote, Exception):
+                # a failing symbol is not idle, keep retrying it at the base interval
+                errors.append((symbol, quote))
+                self._intervals[symbol] = self.interval
+                self._next_poll[symbol] = time.monotonic() + self.interval
+                continue
+            changes = {}
+            last = self._last.get(symbol)
+            for field in self.fields:
+                old = getattr(last, field, None)
+                new = getattr(quote, field)
+                if last is None or old != new:
+                    changes[field] = (old, new)
+            self._last[symbol] = quote
+            if changes:
+                self._intervals[symbol] = self.interval
+                events.append(QuoteEvent(symbol, changes, quote))
+            else:
+                self._intervals[symbol] = min(
+                    self._intervals[symbol] * self.backoff, self.max_interval
+                )
+            self._next_poll[symbol] = time.monotonic() + self._intervals[symbol]
+        for symbol, error in errors:
+            for callback in self.error_callbacks:
+                callback(symbol, error)
+        for event in events:
+            for callback in self.callbacks:
+                callback(event)
+        return events
+
+    def __iter__(self):
+        """
+        Polls until stop() is called, yielding every QuoteEvent.
+
+        Yields:
+            QuoteEvent: The next change in a watched quote.
+        """
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            yield from self.poll()
+            if self._next_poll:
+                wait = min(self._next_poll.values()) - time.monotonic()
+            else:
+                wait = self.interval
+            self._stopped.wait(max(wait, 0))
+
+    def run(self):
+        """Polls until stop() is called, delivering events to the subscribers."""
+        for _ in self:
+            pass
+
+    def stop(self):
+        """Stops a running stream after the current poll."""
+        self._stopped.set()
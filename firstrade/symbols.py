@@ -1,7 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Optional
+
 from bs4 import BeautifulSoup
+from lxml import etree
 
 from firstrade import urls
 from firstrade.account import FTSession
+from firstrade.utils import parse_xml, to_int
+
+
+class Quote(NamedTuple):
+    """
+    Immutable quote record produced by the quote parser.
+
+    It has no reference to the session and no per-instance dict,
+    so large quote histories are cheap to keep, pickle and serialize.
+    The fields have the same names and meaning as on SymbolQuote.
+    """
+
+    symbol: str
+    underlying_symbol: str
+    tick: str
+    exchange: str
+    bid: float
+    ask: float
+    last: float
+    bid_size: int
+    ask_size: int
+    last_size: int
+    bid_mmid: str
+    ask_mmid: str
+    last_mmid: str
+    change: float
+    high: Optional[float]
+    low: Optional[float]
+    change_color: str
+    volume: int
+    bidxask: str
+    quote_time: str
+    last_trade_time: str
+    real_time: bool
+    fractional: bool
+    err_code: str
+    company_name: str
 
 
 class SymbolQuote:
@@ -17,15 +58,18 @@ class SymbolQuote:
         ask (float): The ask price for the symbol.
         last (float): The last traded price for the symbol.
         change (float): The change in price for the symbol.
-        high (float): The highest price for the symbol during the trading day.
-        low (float): The lowest price for the symbol during the trading day.
-        volume (str): The volume of shares traded for the symbol.
+        high (float): The highest price for the symbol during the trading day,
+                      or None if not available.
+        low (float): The lowest price for the symbol during the trading day,
+                     or None if not available.
+        volume (int): The volume of shares traded for the symbol.
         company_name (str): The name of the company associated with the symbol.
         real_time (bool): If the quote is real-time or not
         fractional (bool):  If the stock can be traded fractionally, or not
+        quote (Quote): The quote record the attributes were read from.
     """
 
-    def __init__(self, ft_session: FTSession, symbol: str):
+    def __init__(self, ft_session: FTSession, symbol: str, max_age=None):
         """
         Initializes a new instance of the SymbolQuote class.
 
@@ -33,45 +77,164 @@ class SymbolQuote:
             ft_session (FTSession):
                 The session object used for making HTTP requests to Firstrade.
             symbol (str): The symbol for which the quote information is retrieved.
+            max_age (float, optional): Maximum age in seconds of a quote served from
+                the session quote cache. Use 0 to force a fresh quote.
+                Defaults to the cache ttl of the session.
         """
         self.ft_session = ft_session
         self.symbol = symbol
-        symbol_data = self.ft_session.get(
-            url=urls.quote(self.symbol), headers=urls.session_headers()
+        self.quote = fetch_quote(ft_session, symbol, max_age)
+        for name, value in zip(Quote._fields, self.quote):
+            setattr(self, name, value)
+
+
+def fetch_quote(ft_session: FTSession, symbol: str, max_age=None):
+    """
+    Retrieves the quote record for a symbol, using the session quote cache.
+
+    Args:
+        ft_session (FTSession):
+            The session object used for making HTTP requests to Firstrade.
+        symbol (str): The symbol for which the quote information is retrieved.
+        max_age (float, optional): Maximum age in seconds of a quote served from
+            the session quote cache. Use 0 to force a fresh quote.
+            Defaults to the cache ttl of the session.
+
+    Returns:
+        Quote: The quote for the symbol.
+    """
+    quote = ft_session.quote_cache.get(symbol, max_age)
+    if quote is None:
+        symbol_data = ft_session.get(
+            url=urls.quote(symbol), headers=urls.session_headers()
         )
-        soup = BeautifulSoup(symbol_data.text, "xml")
-        quote = soup.find("quote")
-        self.symbol = quote.find("symbol").text
-        self.underlying_symbol = quote.find("underlying_symbol").text
-        self.tick = quote.find("tick").text
-        self.exchange = quote.find("exchange").text
-        self.bid = float(quote.find("bid").text.replace(",", ""))
-        self.ask = float(quote.find("ask").text.replace(",", ""))
-        self.last = float(quote.find("last").text.replace(",", ""))
-        temp_store = quote.find("bidsize").text.replace(",", "")
-        self.bid_size = int(temp_store) if temp_store.isdigit() else 0
-        temp_store = quote.find("asksize").text.replace(",", "")
-        self.ask_size = int(temp_store) if temp_store.isdigit() else 0
-        temp_store = quote.find("lastsize").text.replace(",", "")
-        self.last_size = int(temp_store) if temp_store.isdigit() else 0
-        self.bid_mmid = quote.find("bidmmid").text
-        self.ask_mmid = quote.find("askmmid").text
-        self.last_mmid = quote.find("lastmmid").text
-        self.change = float(quote.find("change").text.replace(",", ""))
-        if quote.find("high").text == "N/A":
-            self.high = None
-        else:
-            self.high = float(quote.find("high").text.replace(",", ""))
-        if quote.find("low").text == "N/A":
-            self.low = "None"
-        else:
-            self.low = float(quote.find("low").text.replace(",", ""))
-        self.change_color = quote.find("changecolor").text
-        self.volume = quote.find("vol").text
-        self.bidxask = quote.find("bidxask").text
-        self.quote_time = quote.find("quotetime").text
-        self.last_trade_time = quote.find("lasttradetime").text
-        self.real_time = quote.find("realtime").text == "T"
-        self.fractional = quote.find("fractional").text == "T"
-        self.err_code = quote.find("errcode").text
-        self.company_name = quote.find("companyname").text
+        quote = parse_quote(symbol_data.content)
+        ft_session.quote_cache.put(symbol, quote)
+    return quote
+
+
+def parse_quote(xml_string, parser="lxml"):
+    """
+    Parses a quote response from Firstrade.
+
+    Args:
+        xml_string (str or bytes): The XML returned by the quote endpoint.
+        parser (str, optional): "lxml" to read the quote with lxml.etree in a single
+            pass, falling back to BeautifulSoup if lxml cannot parse it, or "bs4" to
+            always use BeautifulSoup. Defaults to "lxml".
+
+    Returns:
+        Quote: The parsed quote.
+    """
+    quote = None
+    if parser == "lxml":
+        try:
+            quote = _read_quote_lxml(xml_string)
+        except etree.XMLSyntaxError:
+            quote = None
+    if quote is None:
+        quote = _read_quote_bs4(xml_string)
+
+    fields = {}
+    fields["symbol"] = quote["symbol"]
+    fields["underlying_symbol"] = quote["underlying_symbol"]
+    fields["tick"] = quote["tick"]
+    fields["exchange"] = quote["exchange"]
+    fields["bid"] = float(quote["bid"].replace(",", ""))
+    fields["ask"] = float(quote["ask"].replace(",", ""))
+    fields["last"] = float(quote["last"].replace(",", ""))
+    fields["bid_size"] = to_int(quote["bidsize"])
+    fields["ask_size"] = to_int(quote["asksize"])
+    fields["last_size"] = to_int(quote["lastsize"])
+    fields["bid_mmid"] = quote["bidmmid"]
+    fields["ask_mmid"] = quote["askmmid"]
+    fields["last_mmid"] = quote["lastmmid"]
+    fields["change"] = float(quote["change"].replace(",", ""))
+    if quote["high"] == "N/A":
+        fields["high"] = None
+    else:
+        fields["high"] = float(quote["high"].replace(",", ""))
+    if quote["low"] == "N/A":
+        fields["low"] = None
+    else:
+        fields["low"] = float(quote["low"].replace(",", ""))
+    fields["change_color"] = quote["changecolor"]
+    fields["volume"] = to_int(quote["vol"])
+    fields["bidxask"] = quote["bidxask"]
+    fields["quote_time"] = quote["quotetime"]
+    fields["last_trade_time"] = quote["lasttradetime"]
+    fields["real_time"] = quote["realtime"] == "T"
+    fields["fractional"] = quote["fractional"] == "T"
+    fields["err_code"] = quote["errcode"]
+    fields["company_name"] = quote["companyname"]
+    return Quote(**fields)
+
+
+def _read_quote_lxml(xml_string):
+    """
+    Reads the elements of the quote with lxml.
+
+    Args:
+        xml_string (str or bytes): The XML returned by the quote endpoint.
+
+    Returns:
+        dict: The text of each child of the quote element keyed by tag,
+        or None if the response contains no quote.
+    """
+    root = parse_xml(xml_string)
+    quote = root if root.tag == "quote" else root.find(".//quote")
+    if quote is None:
+        return None
+    return {element.tag: element.text or "" for element in quote}
+
+
+def _read_quote_bs4(xml_string):
+    """
+    Reads the elements of the quote with BeautifulSoup.
+
+    Args:
+        xml_string (str or bytes): The XML returned by the quote endpoint.
+
+    Returns:
+        dict: The text of each child of the quote element keyed by tag.
+    """
+    quote = BeautifulSoup(xml_string, "xml").find("quote")
+    return {element.name: element.text for element in quote.find_all(recursive=False)}
+
+
+def get_quotes(ft_session: FTSession, symbols, max_workers=8, max_age=None):
+    """
+    Retrieves quotes for many symbols concurrently.
+
+    The requests are spread over a bounded thread pool and all go through
+    the same session, so they share its cookies and connection pool.
+    A symbol that fails to quote does not abort the batch.
+
+    Args:
+        ft_session (FTSession):
+            The session object used for making HTTP requests to Firstrade.
+        symbols (list): The symbols to retrieve quotes for.
+        max_workers (int, optional): Maximum number of concurrent requests.
+                                     Defaults to 8.
+        max_age (float, optional): Maximum age in seconds of quotes served from
+                                   the session quote cache. Defaults to the cache ttl.
+
+    Returns:
+        dict: Dictionary with the requested symbols as keys and either a
+        Quote or the exception raised while quoting that symbol as values.
+    """
+    symbols = list(dict.fromkeys(symbols))
+    quotes = {}
+    if not symbols:
+        return quotes
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(symbols))) as executor:
+        futures = {
+            symbol: executor.submit(fetch_quote, ft_session, symbol, max_age)
+            for symbol in symbols
+        }
+        for symbol, future in futures.items():
+            try:
+                quotes[symbol] = future.result()
+            except Exception as e:
+                quotes[symbol] = e
+    return quotes
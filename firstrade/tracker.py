@@ -0,0 +1,116 @@
+from typing import NamedTuple
+
+from firstrade.account import FTAccountData
+
+
+class PositionDelta(NamedTuple):
+    """
+    The changes in the positions of an account since the last snapshot.
+
+    Attributes:
+        account (str): The account number.
+        added (dict): Positions that are new, keyed by ticker.
+        removed (dict): Positions that are no longer held, keyed by ticker.
+        changed (dict): Tickers mapped to (old position, new position).
+    """
+
+    account: str
+    added: dict
+    removed: dict
+    changed: dict
+
+
+class PositionTracker:
+    """
+    Keeps the last positions snapshot per account and reports only the changes.
+
+    Subscribers are called with a PositionDelta for each account whose
+    positions changed in the compared fields, so their work is proportional
+    to the changes rather than to the size of the portfolio.
+    """
+
+    FIELDS = ("quantity",)
+
+    def __init__(self, account_data: FTAccountData, accounts=None, fields=FIELDS):
+        """
+        Initializes a new instance of the PositionTracker class.
+
+        Args:
+            account_data (FTAccountData): The account data used to get the positions.
+            accounts (list, optional): Account numbers to track. Defaults to all accounts.
+            fields (tuple, optional): The position fields to compare. Prices move on
+                                      every tick, so defaults to the quantity only.
+        """
+        self.account_data = account_data
+        self.accounts = accounts
+        self.fields = tuple(fields)
+        self.callbacks = []
+        self.snapshots = {}
+
+    def subscribe(self, callback):
+        """
+        Registers a function that is called with every PositionDelta.
+
+        Args:
+            callback (callable): Function taking a single PositionDelta.
+        """
+        self.callbacks.append(callback)
+
+    def poll(self):
+        """
+        Gets the current positions and reports the changes since the last poll.
+
+        Returns:
+            list: A PositionDelta for every account whose positions changed.
+                  The first poll of an account reports all positions as added.
+        """
+        if self.accounts is None:
+            positions = self.account_data.get_all_positions()
+        else:
+            positions = {
+                account: self.account_data.get_positions(account)
+                for account in self.accounts
+            }
+        deltas = []
+        for account, account_positions in positions.items():
+            delta = self.update(account, account_positions)
+            if delta is not None:
+                deltas.append(delta)
+        return deltas
+
+    def update(self, account, positions):
+        """
+        Compares new positions of an account with its snapshot and stores them.
+
+        Args:
+            account (str): The account number.
+            positions (dict): The held positions with the ticker as the key,
+                              as returned by FTAccountData.get_positions.
+
+        Returns:
+            PositionDelta: The changes, or None if nothing changed.
+        """
+        previous = self.snapshots.get(account, {})
+        self.snapshots[account] = positions
+        added = {
+            ticker: position
+            for ticker, position in positions.items()
+            if ticker not in previous
+        }
+        removed = {
+            ticker: position
+            for ticker, position in previous.items()
+            if ticker not in positions
+        }
+        changed = {
+            ticker: (previous[ticker], position)
+            for ticker, position in positions.items()
+            if ticker in previous
+            and any(previous[ticker][field] != position[field] for field in self.fields)
+        }
+        if not (added or removed or changed):
+            return None
+        delta = PositionDelta(account, added, removed, changed)
+        for callback in self.callbacks:
+            callback(delta)
+        return delta
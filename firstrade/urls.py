@@ -25,6 +25,7 @@ def orderbar():
 def account_status():
     return "https://invest.firstrade.com/cgi-bin/account_status"
 
+
 def order_list():
     return "https://invest.firstrade.com/cgi-bin/orderstatus"
 
@@ -44,3 +45,9 @@ def session_headers():
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/116.0.0.0 Safari/537.36 Edg/116.0.1938.81",
     }
     return headers
+
+
+def order_headers():
+    headers = session_headers()
+    headers["Content-Type"] = "application/x-www-form-urlencoded"
+    return headers
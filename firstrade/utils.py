@@ -0,0 +1,84 @@
+from decimal import Decimal, InvalidOperation
+
+from lxml import etree
+
+
+def parse_xml(xml_string):
+    """
+    Parses an XML response with lxml.
+
+    Args:
+        xml_string (str or bytes): The XML to parse.
+
+    Returns:
+        lxml.etree._Element: The root element.
+
+    Raises:
+        lxml.etree.XMLSyntaxError: If the response is not well-formed XML.
+    """
+    # parsers are not shared so responses can be parsed from several threads
+    if isinstance(xml_string, str):
+        parser = etree.XMLParser(encoding="utf-8", resolve_entities=False)
+        return etree.fromstring(xml_string.encode("utf-8"), parser)
+    parser = etree.XMLParser(resolve_entities=False)
+    return etree.fromstring(xml_string, parser)
+
+
+def _clean_number(text):
+    """Strips thousands separators, percent signs and whitespace from a number."""
+    if text is None:
+        return ""
+    return text.replace(",", "").replace("%", "").strip()
+
+
+def to_float(text):
+    """
+    Converts a number from a Firstrade response to a float.
+
+    Returns:
+        float: The number, or None if the text is not a number (e.g. "N/A").
+    """
+    try:
+        return float(_clean_number(text))
+    except ValueError:
+        return None
+
+
+def to_decimal(text):
+    """
+    Converts a number from a Firstrade response to a Decimal.
+
+    Returns:
+        Decimal: The number, or None if the text is not a number (e.g. "N/A").
+    """
+    try:
+        return Decimal(_clean_number(text))
+    except InvalidOperation:
+        return None
+
+
+def to_int(text):
+    """
+    Converts a whole number from a Firstrade response to an int.
+
+    Returns:
+        int: The number, or 0 if the text is not a whole number.
+    """
+    text = _clean_number(text)
+    return int(text) if text.isdigit() else 0
+
+
+def to_number(text, numeric_type=float):
+    """
+    Converts a number from a Firstrade response to the given numeric type.
+
+    Args:
+        text (str): The number as text, e.g. "12,345.67".
+        numeric_type (type, optional): float or decimal.Decimal. Defaults to float.
+
+    Returns:
+        float or Decimal: The number, or None if the text is not a number.
+    """
+    if numeric_type is Decimal:
+        return to_decimal(text)
+    return to_float(text)
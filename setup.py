@@ -16,7 +16,8 @@ setuptools.setup(
     download_url="https://github.com/MaxxRK/firstrade-api/archive/refs/tags/0021.tar.gz",
     keywords=["FIRSTRADE", "API"],
     install_requires=["requests", "beautifulsoup4", "lxml"],
-    packages=["firstrade"],
+    extras_require={"numpy": ["numpy"], "async": ["httpx"]},
+    packages=["firstrade", "firstrade.aio"],
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -46,6 +46,14 @@ print(f"Fractional: {quote.fractional}")
 print(f"Error Code: {quote.err_code}")
 print(f"Company Name: {quote.company_name}")
 
+# Get quotes for several symbols at once
+quotes = symbols.get_quotes(ft_ss, ["INTC", "AAPL", "MSFT"])
+for symbol, symbol_quote in quotes.items():
+    if isinstance(symbol_quote, Exception):
+        print(f"Failed to quote {symbol}: {symbol_quote}")
+    else:
+        print(f"{symbol}: {symbol_quote.last}")
+
 # Get positions and print them out for an account.
 positions = ft_accounts.get_positions(account=ft_accounts.account_numbers[1])
 for key in ft_accounts.securities_held:
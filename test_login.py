@@ -0,0 +1,110 @@
+"""
+Checks the number of requests a login makes, against a local stub of Firstrade.
+
+Run it with python test_login.py, no Firstrade account is needed.
+"""
+
+import collections
+import http.client
+import tempfile
+import threading
+import types
+from unittest import mock
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import BaseAdapter
+
+from firstrade import account
+
+SESSION_COOKIE = "sid=stub"
+
+
+class StubAdapter(BaseAdapter):
+    """Answers the login endpoints like Firstrade and counts requests per path."""
+
+    def __init__(self):
+        super().__init__()
+        self.counts = collections.Counter()
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        path = urlparse(request.url).path
+        with self._lock:
+            self.counts[path] += 1
+        headers = http.client.HTTPMessage()
+        body = self.reply(request, path, headers)
+
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url
+        response.request = request
+        response._content = body.encode()
+        # requests reads the cookies of a response from the raw http.client message
+        response.raw = types.SimpleNamespace(
+            _original_response=types.SimpleNamespace(msg=headers)
+        )
+        return response
+
+    def reply(self, request, path, headers):
+        """
+        Gets the body of the response to a request.
+
+        Subclasses override it to answer more endpoints.
+
+        Args:
+            request (requests.PreparedRequest): The request.
+            path (str): The path of the request URL.
+            headers (http.client.HTTPMessage): The response headers, to add to.
+
+        Returns:
+            str: The response body.
+        """
+        if path == "/cgi-bin/getxml":
+            if SESSION_COOKIE not in request.headers.get("Cookie", ""):
+                return "/cgi-bin/sessionfailed?reason=6"
+        elif path == "/cgi-bin/enter_pin":
+            headers["Set-Cookie"] = (
+                f"{SESSION_COOKIE}; Domain=invest.firstrade.com; Path=/"
+            )
+        return ""
+
+    def close(self):
+        pass
+
+
+def stub_session(stub, profile_path, **kwargs):
+    """Creates an FTSession whose requests are all answered by the stub."""
+    with mock.patch.object(account, "HTTPAdapter", lambda **adapter_kwargs: stub):
+        return account.FTSession(
+            "user", "password", "1234", profile_path=profile_path, **kwargs
+        )
+
+
+def login(profile_path):
+    """Logs in against a fresh stub and returns its request counts."""
+    stub = StubAdapter()
+    stub_session(stub, profile_path)
+    return dict(stub.counts)
+
+
+def test_cold_login():
+    with tempfile.TemporaryDirectory() as profile_path:
+        assert login(profile_path) == {
+            "/cgi-bin/getxml": 2,
+            "/cgi-bin/login": 2,
+            "/cgi-bin/enter_pin": 1,
+        }
+
+
+def test_warm_login():
+    with tempfile.TemporaryDirectory() as profile_path:
+        login(profile_path)
+        # the saved cookies are still logged in, so only the probe is sent
+        assert login(profile_path) == {"/cgi-bin/getxml": 1}
+
+
+if __name__ == "__main__":
+    test_cold_login()
+    test_warm_login()
+    print("Login request counts are as expected.")
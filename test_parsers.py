@@ -0,0 +1,176 @@
+"""
+Checks the response parsers against the sample responses in fixtures/.
+
+Run it with python test_parsers.py, no Firstrade account is needed.
+"""
+
+import os
+from decimal import Decimal
+
+from firstrade.account import Position, parse_position_records, parse_positions
+from firstrade.order import parse_orderbar
+from firstrade.symbols import Quote, parse_quote
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def fixture(name):
+    """Reads a sample response as bytes, as the parsers get them."""
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+
+ORDER_TABLE = {
+    "Action": "Buy",
+    "Quantity": "10",
+    "Symbol": "INTC",
+    "Price Type": "Limit 30.50",
+    "Duration": "Day",
+    "Est. Total": "$305.00",
+}
+
+
+def test_orderbar_preview():
+    assert parse_orderbar(fixture("orderbar_preview.xml")) == {
+        "warning": "This order may result in an oversold/overbought position in "
+        "your account. Please check your position quantity.",
+        "success": "Yes",
+        **ORDER_TABLE,
+        "orderid": "20240517093015123",
+        "errcode": "0",
+    }
+
+
+def test_orderbar_preview_without_warning():
+    # the summary box is an inbox too, but not inside the error box
+    assert parse_orderbar(fixture("orderbar_preview_no_warning.xml")) == {
+        "success": "Yes",
+        "Action": "Sell",
+        "Quantity": "5",
+        "Symbol": "F",
+        "Price Type": "Market",
+        "Duration": "Day",
+        "Est. Total": "$61.25",
+        "orderid": "20240517093112456",
+        "errcode": "0",
+    }
+
+
+def test_orderbar_submit():
+    assert parse_orderbar(fixture("orderbar_submit.xml"), dry_run=False) == {
+        "success": "Yes",
+        **ORDER_TABLE,
+        "orderid": "118734562",
+        "errcode": "0",
+    }
+
+
+def test_orderbar_rejected():
+    assert parse_orderbar(fixture("orderbar_rejected.xml")) == {
+        "success": "No",
+        "actiondata": '<div class="error">The symbol you entered is not valid.</div>',
+        "errcode": "12",
+    }
+
+
+def test_orderbar_str_and_bytes():
+    xml = fixture("orderbar_preview.xml")
+    assert parse_orderbar(xml.decode("utf-8")) == parse_orderbar(xml)
+
+
+def test_quote():
+    assert parse_quote(fixture("quote.xml")) == Quote(
+        symbol="INTC",
+        underlying_symbol="INTC",
+        tick="U",
+        exchange="NASDAQ",
+        bid=30.48,
+        ask=30.50,
+        last=30.49,
+        bid_size=1200,
+        ask_size=800,
+        last_size=100,
+        bid_mmid="NSDQ",
+        ask_mmid="ARCX",
+        last_mmid="NSDQ",
+        change=-0.27,
+        high=31.02,
+        low=30.11,
+        change_color="red",
+        volume=38512904,
+        bidxask="1,200x800",
+        quote_time="05/17/2024 11:32:05 ET",
+        last_trade_time="05/17/2024 11:32:04 ET",
+        real_time=True,
+        fractional=True,
+        err_code="0",
+        company_name="Intel Corp",
+    )
+
+
+def test_quote_not_available_fields():
+    quote = parse_quote(fixture("quote_closed.xml"))
+    assert quote.last == 612250.0
+    assert quote.change == 1530.0
+    assert quote.high is None and quote.low is None
+    assert quote.last_size == 0
+    assert quote.bid_mmid == ""
+    assert not quote.real_time and not quote.fractional
+    assert quote.company_name == "Berkshire Hathaway Inc & Co"
+
+
+def test_quote_backends_agree():
+    for name in ("quote.xml", "quote_closed.xml"):
+        xml = fixture(name)
+        assert parse_quote(xml, parser="lxml") == parse_quote(xml, parser="bs4")
+
+
+def test_quote_falls_back_to_bs4():
+    # content after the root element is not well-formed XML, so lxml rejects it
+    xml = fixture("quote.xml") + b"<debug>"
+    assert parse_quote(xml) == parse_quote(fixture("quote.xml"))
+
+
+def test_positions():
+    assert parse_position_records(fixture("positions.xml")) == [
+        Position("INTC", Decimal("100"), 30.49, -0.27, -0.88, 38512904),
+        Position("AAPL", Decimal("2.5"), 1190.25, 1.52, 0.13, 41230117),
+        Position("TSLA", Decimal("0.0731"), None, None, None, 0),
+    ]
+
+
+def test_positions_decimal():
+    position = parse_position_records(fixture("positions.xml"), Decimal)[1]
+    assert position.price == Decimal("1190.25")
+    assert position.change_percent == Decimal("0.13")
+
+
+def test_positions_missing_field():
+    # a missing price only affects its own position, the others stay aligned
+    assert parse_position_records(fixture("positions_missing_field.xml")) == [
+        Position("INTC", Decimal("100"), 30.49, -0.27, -0.88, 38512904),
+        Position("AAPL", Decimal("2.5"), None, 1.52, 0.13, 41230117),
+        Position("F", Decimal("40"), 12.25, 0.05, 0.41, 52001337),
+    ]
+
+
+def test_positions_dict():
+    assert parse_positions(fixture("positions.xml"))["AAPL"] == {
+        "quantity": Decimal("2.5"),
+        "price": 1190.25,
+        "change": 1.52,
+        "change_percent": 0.13,
+        "vol": 41230117,
+    }
+
+
+def test_positions_fall_back_to_bs4():
+    xml = fixture("positions_missing_field.xml")
+    assert parse_position_records(xml + b"<debug>") == parse_position_records(xml)
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+    print("Parsed responses are as expected.")